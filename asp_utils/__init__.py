@@ -8,35 +8,61 @@ including API clients, configuration handling, and authentication.
 from .api_client import (
     create_mongodb_connection,
     create_kafka_connection,
+    create_kafka_connections_bulk,
     sp_create_stream_processor,
+    create_stream_processors_bulk,
+    create_stream_processors_batch,
     create_topic,
+    create_topics_bulk,
+    create_topics_async,
     create_simple_mongodb_to_kafka_topic_pipeline,
     create_simple_kafka_topic_to_mongodb_pipeline,
+    build_mongodb_to_kafka_topic_pipeline_json,
+    build_kafka_topic_to_mongodb_pipeline_json,
     execute_stream_processing_javascript,
+    serialize_pipeline,
     sp_process,
     sp_start_processor,
     sp_stop_processor
 )
 
-from .auth import check_atlas_auth_with_login
+from .auth import (
+    check_atlas_auth_with_login,
+    check_atlas_auth_with_login_async,
+    invalidate_auth_cache
+)
 
 from .config_utils import (
     load_json_file,
+    load_json_files,
+    list_json_files,
     validate_main_config
 )
 
 __all__ = [
     'create_mongodb_connection',
     'create_kafka_connection', 
-    'create_stream_processor',
+    'create_kafka_connections_bulk',
+    'sp_create_stream_processor',
+    'create_stream_processors_bulk',
+    'create_stream_processors_batch',
     'create_topic',
+    'create_topics_bulk',
+    'create_topics_async',
     'create_simple_mongodb_to_kafka_topic_pipeline',
     'create_simple_kafka_topic_to_mongodb_pipeline',
+    'build_mongodb_to_kafka_topic_pipeline_json',
+    'build_kafka_topic_to_mongodb_pipeline_json',
     'execute_stream_processing_javascript',
-    'process_temporary_pipeline',
+    'serialize_pipeline',
+    'sp_process',
     'sp_start_processor',
     'sp_stop_processor',
     'check_atlas_auth_with_login',
+    'check_atlas_auth_with_login_async',
+    'invalidate_auth_cache',
     'load_json_file',
+    'load_json_files',
+    'list_json_files',
     'validate_main_config'
 ]
\ No newline at end of file
@@ -6,10 +6,119 @@ Functions for creating and managing MongoDB Atlas Stream Processing resources
 including connections, stream processors, and Kafka topics.
 """
 
+import asyncio
+import atexit
+import itertools
 import json
+import logging
+import os
+import queue
+import re
+import shutil
 import subprocess
-import requests
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, Optional, Union, List
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:  # optional, speeds up serializing large pipelines
+    orjson = None
+
+from .auth import _ATLAS
+
+logger = logging.getLogger(__name__)
+
+# Executables resolved once at import instead of searching PATH on every spawn.
+# Fall back to the bare name so a missing tool fails with the usual error when used.
+_MONGOSH = shutil.which('mongosh') or 'mongosh'
+
+# Matches CLI/shell errors reporting that a resource already exists
+_EXISTS_RE = re.compile(r'already exists|duplicate', re.IGNORECASE)
+
+
+def _is_exists_error(stderr: str) -> bool:
+    """Return True if stderr reports that the resource already exists."""
+    return _EXISTS_RE.search(stderr) is not None
+
+
+# JSON sent to the Atlas CLI or mongosh is machine-read, so skip the padding spaces
+_COMPACT_SEPARATORS = (',', ':')
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=_COMPACT_SEPARATORS)
+
+# Connection configs for `atlas streams connections create --file`. Only the
+# %s fields vary, so each one is filled with its JSON-encoded value instead of
+# building and serializing the whole dict on every call.
+_MONGODB_CONNECTION_TEMPLATE = (
+    '{"type":"Cluster","clusterName":%s,'
+    '"dbRoleToExecute":{"role":%s,"type":%s}}'
+)
+_KAFKA_CONNECTION_TEMPLATE = (
+    '{"name":%s,"type":"Kafka",'
+    '"authentication":{"mechanism":"PLAIN","username":%s,"password":%s},'
+    '"bootstrapServers":%s,'
+    '"config":{"auto.offset.reset":"earliest","group.id":%s},'
+    '"security":{"protocol":"SASL_SSL"}}'
+)
+
+# Pipelines built by the simple pipeline helpers, for callers that only need
+# the JSON passed to mongosh. Each %s is filled with its JSON-encoded value.
+_MONGODB_TO_KAFKA_PIPELINE_TEMPLATE = (
+    '[{"$source":{"connectionName":%s,"db":%s,"coll":%s}},'
+    '{"$emit":{"connectionName":%s,"topic":%s}}]'
+)
+_KAFKA_TO_MONGODB_PIPELINE_TEMPLATE = (
+    '[{"$source":{"connectionName":%s,"topic":%s%s}},'
+    '{"$merge":{"into":{"connectionName":%s,"db":%s,"coll":%s}}}]'
+)
+
+
+# Payloads up to this size fit in a pipe's buffer, so they can be written
+# before the child starts without blocking
+_PIPE_PAYLOAD_LIMIT = 4096
+
+
+def _run_with_stdin(cmd: List[str], payload: bytes, timeout: int) -> subprocess.CompletedProcess:
+    """
+    Run a command with payload on its stdin, capturing its output as bytes.
+    
+    Small payloads are written to an os.pipe() up front and its read end is
+    handed to the child, avoiding subprocess's stdin feeding machinery.
+    """
+    if len(payload) > _PIPE_PAYLOAD_LIMIT:
+        return subprocess.run(cmd, input=payload, capture_output=True, timeout=timeout)
+    
+    read_fd, write_fd = os.pipe()
+    try:
+        os.write(write_fd, payload)
+        os.close(write_fd)
+        write_fd = None
+        return subprocess.run(cmd, stdin=read_fd, capture_output=True, timeout=timeout)
+    finally:
+        os.close(read_fd)
+        if write_fd is not None:
+            os.close(write_fd)
+
+
+# Connections this process has already created or found existing, keyed by
+# (project, instance, connection name). Repeat calls skip the Atlas CLI.
+_SEEN_CONNECTIONS: set[tuple[str, str, str]] = set()
+
+# Shared worker threads for bulk helpers that wait on Atlas CLI / mongosh
+# subprocesses. Threads are enough since the GIL is released while waiting.
+_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+atexit.register(_EXECUTOR.shutdown)
+
 
 def create_mongodb_connection(
     group_id: str,
@@ -21,58 +130,54 @@ def create_mongodb_connection(
 ) -> tuple[bool, bool]:
     """Create a MongoDB Atlas Stream Processing connection using Atlas CLI."""
     
+    # Already created or reused earlier in this run
+    key = (group_id, tenant_name, connection_name)
+    if key in _SEEN_CONNECTIONS:
+        return True, False
+    
     # Create connection configuration
-    connection_config = {
-        "type": "Cluster",
-        "clusterName": cluster_name,
-        "dbRoleToExecute": {
-            "role": role_name,
-            "type": role_type
-        }
-    }
+    connection_config = _MONGODB_CONNECTION_TEMPLATE % (
+        json.dumps(cluster_name),
+        json.dumps(role_name),
+        json.dumps(role_type)
+    )
     
-    # Write temporary config file
-    temp_config_file = "temporary-connection-file.json"
     try:
-        with open(temp_config_file, 'w') as f:
-            json.dump(connection_config, f, indent=2)
-        
-        # Create MongoDB connection using Atlas CLI
+        # Create MongoDB connection using Atlas CLI, passing the config on stdin
         cmd = [
-            'atlas', 'streams', 'connections', 'create',
+            _ATLAS, 'streams', 'connections', 'create',
             connection_name,
             '--projectId', group_id,
             '--instance', tenant_name,
-            '--file', temp_config_file,
+            '--file', '/dev/stdin',
             '--output', 'json'
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        # Output stays as bytes; stderr is only decoded if the command failed
+        result = _run_with_stdin(cmd, connection_config.encode(), timeout=30)
         
         if result.returncode == 0:
-            print(f"✓ Successfully created MongoDB connection: {connection_name}")
+            logger.info("✓ Successfully created MongoDB connection: %s", connection_name)
+            _SEEN_CONNECTIONS.add(key)
             return True, True  # success, was_created
         else:
+            stderr = result.stderr.decode('utf-8', 'replace')
+            
             # Check if connection already exists
-            if "already exists" in result.stderr.lower() or "duplicate" in result.stderr.lower():
-                print(f"⚠ MongoDB connection already exists, reusing: {connection_name}")
+            if _is_exists_error(stderr):
+                logger.warning("⚠ MongoDB connection already exists, reusing: %s", connection_name)
+                _SEEN_CONNECTIONS.add(key)
                 return True, False  # success, was_created
             else:
-                print(f"✗ Failed to create MongoDB connection {connection_name}")
-                print(f"  Error: {result.stderr}")
+                logger.error("✗ Failed to create MongoDB connection %s\n  Error: %s", connection_name, stderr)
                 return False, False  # success, was_created
                 
     except subprocess.TimeoutExpired:
-        print(f"✗ Timeout creating MongoDB connection {connection_name}")
+        logger.error("✗ Timeout creating MongoDB connection %s", connection_name)
         return False, False
     except Exception as e:
-        print(f"✗ Unexpected error creating MongoDB connection {connection_name}: {e}")
+        logger.error("✗ Unexpected error creating MongoDB connection %s: %s", connection_name, e)
         return False, False
-    finally:
-        # Clean up temporary file
-        import os
-        if os.path.exists(temp_config_file):
-            os.remove(temp_config_file)
 
 def create_kafka_connection(
     group_id: str,
@@ -84,70 +189,354 @@ def create_kafka_connection(
 ) -> tuple[bool, bool]:
     """Create a MongoDB Atlas Stream Processing Kafka connection using Atlas CLI."""
     
-    # Convert bootstrap servers from REST endpoint
-    bootstrap_servers = confluent_rest_endpoint.replace('https://', '').replace(':443', ':9092')
+    # Already created or reused earlier in this run
+    key = (group_id, tenant_name, connection_name)
+    if key in _SEEN_CONNECTIONS:
+        return True, False
+    
+    # Convert bootstrap servers from REST endpoint: same host, Kafka port. A bare
+    # "host:port" endpoint is parsed as a network location rather than a scheme and path.
+    rest_endpoint = confluent_rest_endpoint if '://' in confluent_rest_endpoint else '//' + confluent_rest_endpoint
+    bootstrap_servers = f"{urlsplit(rest_endpoint).hostname}:9092"
     
     # Create connection configuration
-    connection_config = {
-        "name": connection_name,
-        "type": "Kafka",
-        "authentication": {
-            "mechanism": "PLAIN",
-            "username": kafka_api_key,
-            "password": kafka_api_secret
-        },
-        "bootstrapServers": bootstrap_servers,
-        "config": {
-            "auto.offset.reset": "earliest",
-            "group.id": f"{connection_name}-consumer-group"
-        },
-        "security": {
-            "protocol": "SASL_SSL"
-        }
-    }
+    connection_config = _KAFKA_CONNECTION_TEMPLATE % (
+        json.dumps(connection_name),
+        json.dumps(kafka_api_key),
+        json.dumps(kafka_api_secret),
+        json.dumps(bootstrap_servers),
+        json.dumps(f"{connection_name}-consumer-group")
+    )
     
-    # Write temporary config file
-    temp_config_file = f"/tmp/{connection_name}_config.json"
     try:
-        with open(temp_config_file, 'w') as f:
-            json.dump(connection_config, f, indent=2)
-        
-        # Create Kafka connection using Atlas CLI
+        # Create Kafka connection using Atlas CLI, passing the config on stdin
         cmd = [
-            'atlas', 'streams', 'connection', 'create',
+            _ATLAS, 'streams', 'connection', 'create',
             connection_name,
             '--projectId', group_id,
             '--instance', tenant_name,
-            '--file', temp_config_file,
+            '--file', '/dev/stdin',
             '--output', 'json'
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        # Output stays as bytes; stderr is only decoded if the command failed
+        result = _run_with_stdin(cmd, connection_config.encode(), timeout=30)
         
         if result.returncode == 0:
-            print(f"✓ Successfully created Kafka connection: {connection_name}")
+            logger.info("✓ Successfully created Kafka connection: %s", connection_name)
+            _SEEN_CONNECTIONS.add(key)
             return True, True  # success, was_created
         else:
+            stderr = result.stderr.decode('utf-8', 'replace')
+            
             # Check if connection already exists
-            if "already exists" in result.stderr.lower() or "duplicate" in result.stderr.lower():
-                print(f"⚠ Kafka connection already exists, reusing: {connection_name}")
+            if _is_exists_error(stderr):
+                logger.warning("⚠ Kafka connection already exists, reusing: %s", connection_name)
+                _SEEN_CONNECTIONS.add(key)
                 return True, False  # success, was_created
             else:
-                print(f"✗ Failed to create Kafka connection {connection_name}")
-                print(f"  Error: {result.stderr}")
+                logger.error("✗ Failed to create Kafka connection %s\n  Error: %s", connection_name, stderr)
                 return False, False  # success, was_created
                 
     except subprocess.TimeoutExpired:
-        print(f"✗ Timeout creating Kafka connection {connection_name}")
+        logger.error("✗ Timeout creating Kafka connection %s", connection_name)
         return False, False
     except Exception as e:
-        print(f"✗ Unexpected error creating Kafka connection {connection_name}: {e}")
+        logger.error("✗ Unexpected error creating Kafka connection %s: %s", connection_name, e)
         return False, False
-    finally:
-        # Clean up temporary file
-        import os
-        if os.path.exists(temp_config_file):
-            os.remove(temp_config_file)
+
+
+def create_kafka_connections_bulk(specs: List[tuple]) -> List[tuple[bool, bool]]:
+    """
+    Create several Kafka connections concurrently on the shared executor.
+    
+    Args:
+        specs: Argument tuples for create_kafka_connection, one per connection
+        
+    Returns:
+        list: (success, was_created) for each spec, in order
+    """
+    return list(_EXECUTOR.map(lambda spec: create_kafka_connection(*spec), specs))
+
+
+class _MongoshSession:
+    """
+    A long-lived mongosh process that evaluates JavaScript sent on stdin.
+    
+    Connecting to a stream processing instance (TLS handshake + authentication)
+    is the bulk of the cost of a single command, so one session is kept open
+    and reused. Each command runs in a try/catch followed by an OK or FAILED
+    status line and a sentinel print so we know where its output ends.
+    Success is read from the status line rather than from stderr, which is a
+    separate pipe and may arrive after the sentinel. Unless echo is off, output
+    is echoed as it arrives, which keeps long-running commands such as
+    sp.process() streaming to the terminal.
+    """
+    
+    def __init__(self, mongosh_args: List[str], echo: bool = True):
+        self._process = subprocess.Popen(
+            [_MONGOSH, *mongosh_args, '--quiet'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1
+        )
+        self._echo = echo
+        self._output = queue.Queue()
+        self._command_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        
+        # Drain both pipes on background threads so neither can fill up and block mongosh
+        for stream_name, stream in (('stdout', self._process.stdout), ('stderr', self._process.stderr)):
+            threading.Thread(
+                target=self._read_stream,
+                args=(stream_name, stream),
+                daemon=True
+            ).start()
+    
+    def _read_stream(self, stream_name: str, stream) -> None:
+        """Forward each line of a pipe to the output queue, then signal EOF with None."""
+        with stream:
+            for line in stream:
+                self._output.put((stream_name, line))
+        self._output.put((stream_name, None))
+    
+    def is_alive(self) -> bool:
+        """Return True while the mongosh process is still running."""
+        return self._process.poll() is None
+    
+    def eval(
+        self,
+        javascript_shell_code: str,
+        timeout: Optional[float] = None,
+        echo: Optional[bool] = None
+    ) -> tuple[bool, str, str]:
+        """
+        Evaluate JavaScript in the session and wait for it to finish.
+        
+        Args:
+            javascript_shell_code: JavaScript code to execute in MongoDB Shell
+            timeout: Seconds to wait for the command to finish (default: no limit)
+            echo: Whether to echo this command's output (default: the session's setting)
+            
+        Returns:
+            tuple: (success, stdout, stderr)
+            
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish in time.
+                The session is closed, since mongosh is still busy with it.
+        """
+        if echo is None:
+            echo = self._echo
+        
+        with self._lock:
+            command_id = next(self._command_ids)
+            ok_status = f"__ASP_OK__{command_id}"
+            failed_status = f"__ASP_FAILED__{command_id}"
+            error_prefix = f"__ASP_ERROR__{command_id} "
+            sentinel = f"__ASP_DONE__{command_id}"
+            # The flag is set on its own line and only cleared on the line that closes the try,
+            # so a command that fails to parse (and takes that line down with it) still reports
+            # a failure. A var statement has no completion value, so the try statement's is the
+            # command's and the shell still prints its result.
+            self._process.stdin.write(
+                f"var __aspFailed = true;\n"
+                f"try {{\n{javascript_shell_code}\n"
+                f";var __aspFailed = false; }} catch (e) {{ print({json.dumps(error_prefix)} + JSON.stringify(String(e))); }}\n"
+                f"print(__aspFailed ? {json.dumps(failed_status)} : {json.dumps(ok_status)}); print({json.dumps(sentinel)});\n"
+            )
+            self._process.stdin.flush()
+            
+            deadline = None if timeout is None else time.monotonic() + timeout
+            stdout_lines = []
+            stderr_lines = []
+            succeeded = False
+            
+            while True:
+                remaining = None if deadline is None else max(0, deadline - time.monotonic())
+                try:
+                    stream_name, line = self._output.get(timeout=remaining)
+                except queue.Empty:
+                    self.close(force=True)
+                    raise subprocess.TimeoutExpired('mongosh', timeout)
+                
+                if line is None:
+                    if stream_name == 'stdout':
+                        # mongosh exited before reaching the sentinel
+                        return False, ''.join(stdout_lines), ''.join(stderr_lines)
+                    continue
+                
+                if stream_name == 'stdout':
+                    status = line.rstrip('\n')
+                    if status == sentinel:
+                        break
+                    if status in (ok_status, failed_status):
+                        succeeded = status == ok_status
+                        continue
+                    if status.startswith(error_prefix):
+                        # The caught error is reported on stderr, as mongosh would have done
+                        line = json.loads(status[len(error_prefix):]) + '\n'
+                        stderr_lines.append(line)
+                        if echo:
+                            sys.stderr.write(line)
+                        continue
+                    stdout_lines.append(line)
+                    if echo:
+                        sys.stdout.write(line)
+                else:
+                    stderr_lines.append(line)
+                    if echo:
+                        sys.stderr.write(line)
+            
+            # Without a status line the command did not run to completion
+            return succeeded, ''.join(stdout_lines), ''.join(stderr_lines)
+    
+    def close(self, force: bool = False) -> None:
+        """Exit mongosh, killing it if it does not exit promptly or force is set."""
+        if self.is_alive():
+            try:
+                if force:
+                    self._process.kill()
+                else:
+                    self._process.stdin.write("exit\n")
+                    self._process.stdin.flush()
+                self._process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._process.kill()
+                self._process.wait()
+        try:
+            self._process.stdin.close()
+        except OSError:
+            pass
+
+
+# Most mongosh sessions kept open per stream processing instance and user
+_MONGOSH_POOL_SIZE = 8
+
+
+class _MongoshSessionPool:
+    """
+    Open mongosh sessions for one instance and user, lent out one command at a time.
+    
+    Parallel commands get separate sessions, so bulk operations still run in
+    parallel, but at most `size` sessions are ever started; further callers
+    wait for a session to be returned. Idle sessions stay open for reuse.
+    """
+    
+    def __init__(self, mongosh_args: List[str], size: int = _MONGOSH_POOL_SIZE, echo: bool = True):
+        self._mongosh_args = mongosh_args
+        self._size = size
+        self._echo = echo
+        self._idle: List[_MongoshSession] = []
+        self._open = 0
+        self._available = threading.Condition()
+    
+    def acquire(self) -> _MongoshSession:
+        """Return an idle session, starting one if the pool is not full yet."""
+        with self._available:
+            while True:
+                while self._idle:
+                    session = self._idle.pop()
+                    if session.is_alive():
+                        return session
+                    session.close()
+                    self._open -= 1
+                if self._open < self._size:
+                    self._open += 1
+                    break
+                self._available.wait()
+        
+        try:
+            return _MongoshSession(self._mongosh_args, echo=self._echo)
+        except BaseException:
+            self._discard()
+            raise
+    
+    def release(self, session: _MongoshSession) -> None:
+        """Return a session to the pool; sessions whose mongosh exited are dropped."""
+        if not session.is_alive():
+            session.close()
+            self._discard()
+            return
+        with self._available:
+            self._idle.append(session)
+            self._available.notify()
+    
+    def _discard(self) -> None:
+        """Free the slot of a session that is no longer open."""
+        with self._available:
+            self._open -= 1
+            self._available.notify()
+    
+    def close(self) -> None:
+        """Close the idle sessions."""
+        with self._available:
+            for session in self._idle:
+                session.close()
+            self._open -= len(self._idle)
+            self._idle.clear()
+
+
+def open_mongosh_session_pool(
+    mongosh_args: List[str],
+    size: int = _MONGOSH_POOL_SIZE,
+    echo: bool = True
+) -> _MongoshSessionPool:
+    """
+    Create a mongosh session pool for callers that manage their own connections.
+    
+    Args:
+        mongosh_args: Connection arguments for mongosh, e.g. [database_url]
+        size: Most sessions started at once (default: 8)
+        echo: Whether sessions echo command output to stdout/stderr as it arrives
+        
+    Returns:
+        The pool; borrow a session with acquire(), evaluate commands with its
+        eval() and hand it back with release(). close() ends the idle sessions.
+    """
+    return _MongoshSessionPool(mongosh_args, size, echo)
+
+
+# mongosh session pools, keyed by (stream_processor_url, connection_user)
+_mongosh_pools: Dict[tuple, _MongoshSessionPool] = {}
+_mongosh_pools_lock = threading.Lock()
+
+
+@lru_cache(maxsize=16)
+def _norm_url(url: str) -> str:
+    """Return the URL ending with a slash, as mongosh expects."""
+    return url if url.endswith('/') else url + '/'
+
+
+def _get_mongosh_pool(
+    connection_user: str,
+    connection_password: str,
+    stream_processor_url: str
+) -> _MongoshSessionPool:
+    """Return the mongosh session pool for the instance and user, creating it if needed."""
+    key = (stream_processor_url, connection_user)
+    with _mongosh_pools_lock:
+        pool = _mongosh_pools.get(key)
+        if pool is None:
+            pool = _MongoshSessionPool([
+                stream_processor_url,
+                '--tls',
+                '--authenticationDatabase', 'admin',
+                '--username', connection_user,
+                '--password', connection_password
+            ])
+            _mongosh_pools[key] = pool
+        return pool
+
+
+@atexit.register
+def _close_mongosh_sessions() -> None:
+    """Close every open mongosh session when the interpreter exits."""
+    with _mongosh_pools_lock:
+        for pool in _mongosh_pools.values():
+            pool.close()
+        _mongosh_pools.clear()
 
 
 def execute_stream_processing_javascript(
@@ -155,49 +544,74 @@ def execute_stream_processing_javascript(
     connection_password: str,
     stream_processor_url: str,
     javascript_shell_code: str,
-    timeout: int = 300
+    timeout: int = 300,
+    echo: bool = True
 ) -> tuple[bool, str, str]:
     """
     Execute MongoDB Shell JavaScript against the stream processing instance.
     
+    Commands for the same instance and user reuse pooled mongosh sessions, so
+    only the first call on each session pays for connecting and authenticating.
+    
     Args:
         connection_user: MongoDB user for authentication
         connection_password: MongoDB password for authentication  
         stream_processor_url: MongoDB stream processor instance URL
         javascript_shell_code: JavaScript code to execute in MongoDB Shell
         timeout: Timeout in seconds for the command (default: 300)
+        echo: Whether to echo mongosh output as it arrives (default: True). Turn it
+            off when running from worker threads whose output should not interleave.
         
     Returns:
         tuple: (success, stdout, stderr)
     """
     
-    # Ensure URL ends with exactly one slash
-    if not stream_processor_url.endswith('/'):
-        stream_processor_url += '/'
+    stream_processor_url = _norm_url(stream_processor_url)
     
     try:
-        print(f"Executing JavaScript: {javascript_shell_code}")
-        
-        # Do exactly what worked: echo 'command' | mongosh with all the args
-        full_command = f'echo \'{javascript_shell_code}\' | mongosh "{stream_processor_url}" --tls --authenticationDatabase admin --username {connection_user} --password {connection_password}'
+        logger.info("Executing JavaScript: %s", javascript_shell_code)
         
-        # Execute with streaming output (no capture_output to allow real-time streaming)
-        result = subprocess.run(full_command, shell=True, text=True, timeout=timeout)
-        
-        return (result.returncode == 0, "Command executed with streaming output", "")
+        pool = _get_mongosh_pool(connection_user, connection_password, stream_processor_url)
+        session = pool.acquire()
+        try:
+            # Output is echoed as it streams in (if enabled) and also returned to the caller
+            return session.eval(javascript_shell_code, timeout=timeout, echo=echo)
+        finally:
+            pool.release(session)
         
     except Exception as e:
         error_msg = f"✗ Unexpected error executing JavaScript code: {e}"
-        print(error_msg)
+        logger.error("%s", error_msg)
         return (False, "", error_msg)
 
 
+def serialize_pipeline(pipeline: Union[List[Dict[str, Any]], str, bytes]) -> str:
+    """
+    Serialize a pipeline to the compact JSON passed to mongosh.
+    
+    Callers that send the same pipeline more than once (e.g. a dry run followed
+    by the real run) can serialize it once and pass the string instead.
+    
+    Args:
+        pipeline: List of pipeline stages, or pipeline JSON that is already serialized
+        
+    Returns:
+        str: Pipeline JSON
+    """
+    if isinstance(pipeline, str):
+        return pipeline
+    if isinstance(pipeline, bytes):
+        return pipeline.decode('utf-8')
+    return _dumps(pipeline)
+
+
 def sp_create_stream_processor(
     connection_user: str,
     connection_password: str,
     stream_processor_url: str,
     stream_processor_name: str,
-    pipeline: List[Dict[str, Any]]
+    pipeline: Union[List[Dict[str, Any]], str, bytes],
+    echo: bool = True
 ) -> bool:
     """
     Create a stream processor with a custom pipeline using mongosh and sp.createStreamProcessor.
@@ -207,48 +621,147 @@ def sp_create_stream_processor(
         connection_password: MongoDB password for authentication  
         stream_processor_url: MongoDB stream processor instance URL
         stream_processor_name: Name of the stream processor
-        pipeline: List of pipeline stages for the stream processor
+        pipeline: List of pipeline stages, or JSON from serialize_pipeline()
+        echo: Whether to echo mongosh output as it arrives (default: True)
         
     Returns:
         bool: True if stream processor was created successfully, False otherwise
     """
     
     # Create JavaScript command for mongosh
-    pipeline_json = json.dumps(pipeline)
-    js_command = f'sp.createStreamProcessor("{stream_processor_name}", {pipeline_json})'
+    pipeline_json = serialize_pipeline(pipeline)
+    js_command = f'sp.createStreamProcessor({json.dumps(stream_processor_name)}, {pipeline_json})'
     
     # Execute the JavaScript code
     success, stdout, stderr = execute_stream_processing_javascript(
         connection_user,
         connection_password,
         stream_processor_url,
-        js_command
+        js_command,
+        echo=echo
     )
     
     if success:
         # Check if creation was successful or if it already exists
-        if "already exists" in stderr.lower() or "duplicate" in stderr.lower():
-            print(f"⚠ Stream processor already exists: {stream_processor_name}")
+        if _is_exists_error(stderr):
+            logger.warning("⚠ Stream processor already exists: %s", stream_processor_name)
             return True
         else:
-            print(f"✓ Successfully created stream processor: {stream_processor_name}")
+            logger.info("✓ Successfully created stream processor: %s", stream_processor_name)
             return True
     else:
         # Check for already exists error in stderr
-        if "already exists" in stderr.lower() or "duplicate" in stderr.lower():
-            print(f"⚠ Stream processor already exists: {stream_processor_name}")
+        if _is_exists_error(stderr):
+            logger.warning("⚠ Stream processor already exists: %s", stream_processor_name)
             return True
         else:
-            print(f"✗ Failed to create stream processor {stream_processor_name}")
-            print(f"  Error: {stderr}")
+            logger.error("✗ Failed to create stream processor %s\n  Error: %s", stream_processor_name, stderr)
             return False
 
 
+def create_stream_processors_bulk(
+    connection_user: str,
+    connection_password: str,
+    stream_processor_url: str,
+    processors: Dict[str, List[Dict[str, Any]]],
+    max_workers: int = 8
+) -> Dict[str, bool]:
+    """
+    Create several stream processors concurrently.
+    
+    Args:
+        connection_user: MongoDB user for authentication
+        connection_password: MongoDB password for authentication  
+        stream_processor_url: MongoDB stream processor instance URL
+        processors: Mapping of stream processor name to its pipeline
+        max_workers: Maximum number of processors created at once (default: 8)
+        
+    Returns:
+        dict: Stream processor name -> True if it was created or already exists
+    """
+    names = list(processors)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            lambda name: sp_create_stream_processor(
+                connection_user,
+                connection_password,
+                stream_processor_url,
+                name,
+                processors[name]
+            ),
+            names
+        )
+        return dict(zip(names, results))
+
+
+# Prefix of the per-processor result lines printed by create_stream_processors_batch()
+_BATCH_RESULT_MARKER = '__ASP_RESULT__'
+
+
+def create_stream_processors_batch(
+    connection_user: str,
+    connection_password: str,
+    stream_processor_url: str,
+    specs: List[tuple[str, Union[List[Dict[str, Any]], str, bytes]]]
+) -> Dict[str, bool]:
+    """
+    Create several stream processors with a single mongosh command.
+    
+    Every sp.createStreamProcessor() call runs in its own try/catch and prints
+    a result line, so one failure does not stop the rest of the batch.
+    
+    Args:
+        connection_user: MongoDB user for authentication
+        connection_password: MongoDB password for authentication  
+        stream_processor_url: MongoDB stream processor instance URL
+        specs: (stream processor name, pipeline) pairs
+        
+    Returns:
+        dict: Stream processor name -> True if it was created or already exists
+    """
+    statements = []
+    for stream_processor_name, pipeline in specs:
+        name_json = json.dumps(stream_processor_name)
+        statements.append(
+            f'try{{sp.createStreamProcessor({name_json},{serialize_pipeline(pipeline)});'
+            f'print("{_BATCH_RESULT_MARKER}"+JSON.stringify([{name_json},null]))}}'
+            f'catch(e){{print("{_BATCH_RESULT_MARKER}"+JSON.stringify([{name_json},String(e.message)]))}}'
+        )
+    
+    success, stdout, stderr = execute_stream_processing_javascript(
+        connection_user,
+        connection_password,
+        stream_processor_url,
+        '\n'.join(statements)
+    )
+    
+    # Processors without a result line (e.g. mongosh exited) count as failed
+    results = {stream_processor_name: False for stream_processor_name, _ in specs}
+    for line in stdout.splitlines():
+        if not line.startswith(_BATCH_RESULT_MARKER):
+            continue
+        stream_processor_name, error = json.loads(line[len(_BATCH_RESULT_MARKER):])
+        if error is None:
+            logger.info("✓ Successfully created stream processor: %s", stream_processor_name)
+            results[stream_processor_name] = True
+        elif _is_exists_error(error):
+            logger.warning("⚠ Stream processor already exists: %s", stream_processor_name)
+            results[stream_processor_name] = True
+        else:
+            logger.error("✗ Failed to create stream processor %s\n  Error: %s", stream_processor_name, error)
+    
+    if not success and not all(results.values()):
+        logger.error("  mongosh error: %s", stderr)
+    
+    return results
+
+
 def sp_process(
     connection_user: str,
     connection_password: str,
     stream_processor_url: str,
-    pipeline: List[Dict[str, Any]],
+    pipeline: Union[List[Dict[str, Any]], str, bytes],
     dlq: Optional[str] = None,
     dry_run: bool = False,
     timeout: int = 300
@@ -260,7 +773,7 @@ def sp_process(
         connection_user: MongoDB user for authentication
         connection_password: MongoDB password for authentication  
         stream_processor_url: MongoDB stream processor instance URL
-        pipeline: List of pipeline stages to execute
+        pipeline: List of pipeline stages, or JSON from serialize_pipeline()
         dlq: Dead letter queue name (optional)
         dry_run: Whether to run in dry-run mode (default: False)
         timeout: Timeout in seconds for the command (default: 300)
@@ -270,7 +783,7 @@ def sp_process(
     """
     
     # Create JavaScript command for sp.process()
-    pipeline_json = json.dumps(pipeline)
+    pipeline_json = serialize_pipeline(pipeline)
     
     # Build options object
     options = {}
@@ -281,7 +794,7 @@ def sp_process(
     
     # Create the JavaScript command
     if options:
-        options_json = json.dumps(options)
+        options_json = _dumps(options)
         js_command = f'sp.process({pipeline_json}, {options_json})'
     else:
         js_command = f'sp.process({pipeline_json})'
@@ -318,7 +831,7 @@ def sp_start_processor(
     """
     
     # Create JavaScript command for starting the processor
-    js_command = f'sp["{processor_name}"].start()'
+    js_command = f'sp[{json.dumps(processor_name)}].start()'
     
     # Execute the JavaScript code with custom timeout
     return execute_stream_processing_javascript(
@@ -352,7 +865,7 @@ def sp_stop_processor(
     """
     
     # Create JavaScript command for stopping the processor
-    js_command = f'sp["{processor_name}"].stop()'
+    js_command = f'sp[{json.dumps(processor_name)}].stop()'
     
     # Execute the JavaScript code with custom timeout
     return execute_stream_processing_javascript(
@@ -453,6 +966,91 @@ def create_simple_kafka_topic_to_mongodb_pipeline(
     ]
 
 
+
+def build_mongodb_to_kafka_topic_pipeline_json(
+    mongodb_connection_name: str,
+    database: str,
+    collection: str,
+    kafka_connection_name: str,
+    topic: str
+) -> str:
+    """
+    Build the JSON of create_simple_mongodb_to_kafka_topic_pipeline() directly.
+    
+    The result can be passed as the pipeline of sp_create_stream_processor()
+    or sp_process() without building and serializing the stage dicts.
+    
+    Returns:
+        str: Pipeline JSON
+    """
+    return _MONGODB_TO_KAFKA_PIPELINE_TEMPLATE % (
+        json.dumps(mongodb_connection_name),
+        json.dumps(database),
+        json.dumps(collection),
+        json.dumps(kafka_connection_name),
+        json.dumps(topic)
+    )
+
+
+def build_kafka_topic_to_mongodb_pipeline_json(
+    kafka_connection_name: str,
+    topics: Union[str, List[str]],
+    mongodb_connection_name: str,
+    database: str,
+    collection: str,
+    auto_offset_reset: Optional[str] = None
+) -> str:
+    """
+    Build the JSON of create_simple_kafka_topic_to_mongodb_pipeline() directly.
+    
+    The result can be passed as the pipeline of sp_create_stream_processor()
+    or sp_process() without building and serializing the stage dicts.
+    
+    Returns:
+        str: Pipeline JSON
+    """
+    config = ''
+    if auto_offset_reset:
+        config = ',"config":{"auto_offset_reset":%s}' % json.dumps(auto_offset_reset)
+    
+    return _KAFKA_TO_MONGODB_PIPELINE_TEMPLATE % (
+        json.dumps(kafka_connection_name),
+        json.dumps(topics, separators=_COMPACT_SEPARATORS),
+        config,
+        json.dumps(mongodb_connection_name),
+        json.dumps(database),
+        json.dumps(collection)
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_http_session(rest_endpoint: str) -> 'requests.Session':
+    """
+    Return a pooled HTTP session for a REST endpoint.
+    
+    Sessions keep connections alive, so repeated calls to the same endpoint
+    reuse the TLS connection instead of handshaking for every request.
+    """
+    # requests is slow to import and only topic creation needs it
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    retries = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(['GET', 'POST']),
+        raise_on_status=False
+    )
+    # Pool sized so every worker of a concurrent bulk run keeps its own socket
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 def create_topic(
     rest_endpoint: str,
     cluster_id: str,
@@ -461,6 +1059,7 @@ def create_topic(
     topic_name: str
 ) -> bool:
     """Create a Kafka topic using the Confluent REST API."""
+    import requests
     
     url = f"{rest_endpoint}/kafka/v3/clusters/{cluster_id}/topics"
     
@@ -477,7 +1076,7 @@ def create_topic(
     }
     
     try:
-        response = requests.post(
+        response = _get_http_session(rest_endpoint).post(
             url,
             auth=(api_key, api_secret),
             headers=headers,
@@ -486,10 +1085,10 @@ def create_topic(
         )
         
         if response.status_code == 201:
-            print(f"✓ Successfully created topic: {topic_name}")
+            logger.info("✓ Successfully created topic: %s", topic_name)
             return True
         elif response.status_code == 409:
-            print(f"⚠ Topic already exists: {topic_name}")
+            logger.warning("⚠ Topic already exists: %s", topic_name)
             return True
         else:
             # Check if the error is specifically error code 40002
@@ -497,18 +1096,63 @@ def create_topic(
                 response_json = response.json()
                 error_code = response_json.get('error_code')
                 if error_code == 40002:
-                    print(f"ℹ Topic {topic_name} is already created")
+                    logger.info("ℹ Topic %s is already created", topic_name)
                     return True
             except (json.JSONDecodeError, KeyError):
                 pass
             
-            print(f"✗ Failed to create topic {topic_name}: HTTP {response.status_code}")
-            print(f"  Response: {response.text}")
+            logger.error("✗ Failed to create topic %s: HTTP %s\n  Response: %s", topic_name, response.status_code, response.text)
             return False
             
     except requests.exceptions.RequestException as e:
-        print(f"✗ Network error creating topic {topic_name}: {e}")
+        logger.error("✗ Network error creating topic %s: %s", topic_name, e)
         return False
     except Exception as e:
-        print(f"✗ Unexpected error creating topic {topic_name}: {e}")
-        return False
\ No newline at end of file
+        logger.error("✗ Unexpected error creating topic %s: %s", topic_name, e)
+        return False
+
+
+def create_topics_bulk(
+    rest_endpoint: str,
+    cluster_id: str,
+    api_key: str,
+    api_secret: str,
+    topic_names: List[str],
+    max_workers: int = 8
+) -> Dict[str, bool]:
+    """
+    Create several Kafka topics concurrently using the Confluent REST API.
+    
+    Requests share the endpoint's pooled HTTP session.
+    
+    Returns:
+        dict: Topic name -> True if the topic was created or already exists
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            lambda topic_name: create_topic(rest_endpoint, cluster_id, api_key, api_secret, topic_name),
+            topic_names
+        )
+        return dict(zip(topic_names, results))
+
+
+async def create_topics_async(
+    rest_endpoint: str,
+    cluster_id: str,
+    api_key: str,
+    api_secret: str,
+    topic_names: List[str],
+    concurrency: int = 16
+) -> Dict[str, bool]:
+    """
+    Create several Kafka topics concurrently from asyncio code.
+    
+    Runs create_topics_bulk() on a worker thread with `concurrency` requests
+    in flight at once, all sharing the endpoint's pooled keep-alive HTTP session.
+    
+    Returns:
+        dict: Topic name -> True if the topic was created or already exists
+    """
+    return await asyncio.to_thread(
+        create_topics_bulk, rest_endpoint, cluster_id, api_key, api_secret, topic_names, concurrency
+    )
@@ -5,19 +5,175 @@ Authentication utilities for MongoDB Atlas
 Functions for handling MongoDB Atlas CLI authentication.
 """
 
+import asyncio
+import base64
+import json
+import os
+import shutil
 import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Optional
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11: always ask the Atlas CLI
+    tomllib = None
 
-def check_atlas_auth_with_login() -> bool:
+
+# Atlas CLI executable, resolved once at import and shared with api_client.
+# Falls back to the bare name so a missing CLI fails with the usual error when used.
+_ATLAS = shutil.which('atlas') or 'atlas'
+
+# The Atlas CLI stores its credentials here; it is rewritten on login/logout
+_ATLAS_CONFIG_PATH = Path.home() / '.config' / 'atlascli' / 'config.toml'
+
+# (mtime, size) of the Atlas CLI config when authentication was last confirmed
+_auth_cache: Optional[tuple[float, int]] = None
+
+# Confirmed authentication is also recorded here so later runs can skip the CLI
+_AUTH_CACHE_PATH = Path.home() / '.cache' / 'asp_utils' / 'atlas_auth.json'
+_AUTH_CACHE_TTL = 300
+
+# Answers to the login prompt that mean yes; an empty answer takes the default
+_YES_RESPONSES = frozenset({'', 'y', 'yes'})
+
+
+def _atlas_config_stamp() -> Optional[tuple[float, int]]:
+    """Return (mtime, size) of the Atlas CLI config, or None if it cannot be read."""
+    try:
+        st = os.stat(_ATLAS_CONFIG_PATH)
+    except OSError:
+        return None
+    return (st.st_mtime, st.st_size)
+
+
+def _access_token_expiry(profile: str = 'default') -> Optional[float]:
+    """
+    Return the expiry time of the Atlas CLI access token for a profile.
+    
+    Returns None if there is no token to inspect (e.g. API key authentication,
+    or the config is missing or unreadable), in which case the CLI is asked.
+    """
+    if tomllib is None:
+        return None
+    try:
+        with open(_ATLAS_CONFIG_PATH, 'rb') as f:
+            access_token = tomllib.load(f)[profile]['access_token']
+        # The JWT payload is the middle segment, base64url-encoded without padding
+        payload = access_token.split('.')[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        return float(claims['exp'])
+    except Exception:
+        return None
+
+
+def _read_persisted_auth(config_stamp: tuple[float, int]) -> bool:
+    """Return True if a recent run confirmed authentication with the same Atlas CLI config."""
+    try:
+        with open(_AUTH_CACHE_PATH, 'r') as f:
+            cached = json.load(f)
+        return (
+            tuple(cached['stamp']) == config_stamp
+            and time.time() - cached['ts'] < _AUTH_CACHE_TTL
+        )
+    except Exception:
+        return False
+
+
+def _persist_auth(config_stamp: tuple[float, int]) -> None:
+    """Record confirmed authentication for later runs; failures to write are ignored."""
+    try:
+        _AUTH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(_AUTH_CACHE_PATH, 'w') as f:
+            json.dump({'stamp': list(config_stamp), 'ts': time.time()}, f)
+    except OSError:
+        pass
+
+
+def invalidate_auth_cache() -> None:
+    """Forget the cached authentication result so the next check asks the Atlas CLI."""
+    global _auth_cache
+    _auth_cache = None
+    try:
+        os.remove(_AUTH_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _input_with_timeout(prompt: str, timeout: Optional[float], default: str) -> str:
+    """
+    Read a line from stdin, returning default if nothing is entered within timeout seconds.
+    
+    Exceptions raised by input() (EOFError, KeyboardInterrupt) are re-raised here.
+    """
+    if timeout is None:
+        return input(prompt)
+    
+    result = []
+    
+    def read():
+        try:
+            result.append(input(prompt))
+        except BaseException as e:
+            result.append(e)
+    
+    # Daemon thread so an unanswered prompt doesn't keep the interpreter alive
+    reader = threading.Thread(target=read, daemon=True)
+    reader.start()
+    reader.join(timeout)
+    
+    if not result:
+        print(f"\nNo response after {timeout:g}s, using default: {default}")
+        return default
+    if isinstance(result[0], BaseException):
+        raise result[0]
+    return result[0]
+
+
+def check_atlas_auth_with_login(timeout: Optional[float] = 30) -> bool:
     """
     Check if authenticated with Atlas CLI and prompt for login if not authenticated.
     Returns True if authenticated (or becomes authenticated), False if user declines login.
+    If the login prompt gets no answer within timeout seconds it counts as no, since
+    an interactive login would compete with the still-pending prompt for stdin;
+    pass None to wait indefinitely.
     """
+    global _auth_cache
+    
+    # An unexpired access token means we're logged in, no need to ask the CLI
+    token_expiry = _access_token_expiry()
+    if token_expiry is not None and time.time() < token_expiry:
+        print("✓ Already authenticated with Atlas CLI")
+        return True
+    
+    # Skip the CLI if authentication was confirmed and the credentials haven't changed since
+    config_stamp = _atlas_config_stamp()
+    if config_stamp is not None and config_stamp == _auth_cache:
+        print("✓ Already authenticated with Atlas CLI")
+        return True
+    
+    # A run within the last few minutes may already have asked the CLI
+    if config_stamp is not None and token_expiry is None and _read_persisted_auth(config_stamp):
+        _auth_cache = config_stamp
+        print("✓ Already authenticated with Atlas CLI")
+        return True
+    
     try:
-        # Check current authentication status
-        auth_check = subprocess.run(['atlas', 'auth', 'whoami'], capture_output=True, text=True, timeout=10)
+        # Check current authentication status; only the exit code matters
+        auth_check = subprocess.run(
+            [_ATLAS, 'auth', 'whoami'],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=10
+        )
         if auth_check.returncode == 0:
             print("✓ Already authenticated with Atlas CLI")
+            # Token logins are re-checked through their expiry instead
+            if token_expiry is None and config_stamp is not None:
+                _auth_cache = config_stamp
+                _persist_auth(config_stamp)
             return True
     except Exception as e:
         print(f"✗ Error checking Atlas CLI authentication: {e}")
@@ -27,18 +183,19 @@ def check_atlas_auth_with_login() -> bool:
     print("✗ Not authenticated with Atlas CLI")
     
     try:
-        # Prompt user with default yes
-        response = input("Would you like to login now? [Y/n]: ").strip().lower()
+        # Prompt user with default yes; an unanswered prompt declines
+        response = _input_with_timeout("Would you like to login now? [Y/n]: ", timeout, 'n')
         
-        # Default to 'yes' if empty response
-        if response == '' or response == 'y' or response == 'yes':
+        if response.strip().lower() in _YES_RESPONSES:
             print("Running: atlas auth login")
             try:
                 # Run atlas auth login interactively
-                login_result = subprocess.run(['atlas', 'auth', 'login'], timeout=120)
+                login_result = subprocess.run([_ATLAS, 'auth', 'login'], timeout=120)
                 
                 if login_result.returncode == 0:
                     print("✓ Successfully authenticated with Atlas CLI")
+                    # Login rewrote the credentials; confirm them again on the next check
+                    invalidate_auth_cache()
                     return True
                 else:
                     print("✗ Failed to authenticate with Atlas CLI")
@@ -60,4 +217,11 @@ def check_atlas_auth_with_login() -> bool:
         return False
     except Exception as e:
         print(f"✗ Error during login prompt: {e}")
-        return False
\ No newline at end of file
+        return False
+
+
+async def check_atlas_auth_with_login_async(timeout: Optional[float] = 30) -> bool:
+    """
+    Run check_atlas_auth_with_login in a worker thread without blocking the event loop.
+    """
+    return await asyncio.to_thread(check_atlas_auth_with_login, timeout)
@@ -6,42 +6,117 @@ Functions for loading, validating, and handling configuration files.
 """
 
 import json
-from typing import Dict, Any, Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, IO, List, Optional, Union
 
+try:
+    import orjson
+except ImportError:  # optional, parses faster than json
+    orjson = None
 
-def load_json_file(file_path: str) -> Optional[Dict[str, Any]]:
-    """Load and parse a JSON file."""
+
+# Fields every main config must define
+_REQUIRED_MAIN_FIELDS = frozenset({
+    "confluent-cluster-id",
+    "confluent-rest-endpoint",
+    "mongodb-stream-processor-instance-url",
+    "stream-processor-prefix",
+    "kafka-connection-name",
+    "mongodb-connection-name",
+    "mongodb-cluster-name",
+    "mongodb-group-id",
+    "mongodb-tenant-name"
+})
+
+# Error printed for each missing required field
+_MISSING_FIELD_MESSAGES = {
+    field: f"Error: Missing required field '{field}' in main config"
+    for field in _REQUIRED_MAIN_FIELDS
+}
+
+
+def _parse_json(data: Union[bytes, str]) -> Any:
+    """Parse JSON text; orjson.JSONDecodeError subclasses json's, so callers catch one type."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=64)
+def _read_bytes_cached(file_path: str, mtime_ns: int, size: int) -> bytes:
+    """Read a file; the mtime and size in the key drop stale entries when it changes."""
+    return Path(file_path).read_bytes()
+
+
+def load_json_file(file_path: Union[str, os.PathLike, IO]) -> Optional[Dict[str, Any]]:
+    """
+    Load and parse a JSON file, or an already open file object.
+    
+    File contents are cached until the file changes, so repeated loads of the
+    same file skip the read. Each call parses them again and returns a new
+    object, which the caller is free to modify.
+    """
+    # Paths are reported in full; Path.name would be just the file name
+    if isinstance(file_path, (str, os.PathLike)):
+        source = os.fspath(file_path)
+    else:
+        source = getattr(file_path, 'name', file_path)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        if hasattr(file_path, 'read'):
+            return _parse_json(file_path.read())
+        st = os.stat(file_path)
+        return _parse_json(_read_bytes_cached(os.fspath(file_path), st.st_mtime_ns, st.st_size))
     except FileNotFoundError:
-        print(f"Error: File not found: {file_path}")
+        print(f"Error: File not found: {source}")
         return None
     except json.JSONDecodeError as e:
-        print(f"Error: Invalid JSON in {file_path}: {e}")
+        print(f"Error: Invalid JSON in {source}: {e}")
         return None
     except Exception as e:
-        print(f"Error: Failed to read {file_path}: {e}")
+        print(f"Error: Failed to read {source}: {e}")
         return None
 
 
+def load_json_files(file_paths: List[Union[str, os.PathLike]], max_workers: int = 8) -> List[Optional[Dict[str, Any]]]:
+    """
+    Load several JSON files concurrently.
+    
+    Returns:
+        list: load_json_file() result for each path, in order
+    """
+    file_paths = list(file_paths)
+    
+    # Not worth starting threads for a single file
+    if len(file_paths) <= 1:
+        return [load_json_file(path) for path in file_paths]
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as executor:
+        return list(executor.map(load_json_file, file_paths))
+
+
+def list_json_files(folder: Union[str, os.PathLike]) -> List[Path]:
+    """
+    Return the .json files directly inside a folder.
+    
+    Uses os.scandir, whose entries already know their file type, so no
+    extra stat call is needed per entry.
+    """
+    with os.scandir(folder) as entries:
+        return [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith('.json') and entry.is_file()
+        ]
+
+
 def validate_main_config(config: Dict[str, Any]) -> bool:
     """Validate the main configuration file."""
-    required_fields = [
-        "confluent-cluster-id", 
-        "confluent-rest-endpoint",
-        "mongodb-stream-processor-instance-url",
-        "stream-processor-prefix",
-        "kafka-connection-name",
-        "mongodb-connection-name",
-        "mongodb-cluster-name",
-        "mongodb-group-id",
-        "mongodb-tenant-name"
-    ]
+    missing_fields = _REQUIRED_MAIN_FIELDS.difference(config)
     
-    for field in required_fields:
-        if field not in config:
-            print(f"Error: Missing required field '{field}' in main config")
-            return False
+    # Report every missing field at once
+    for field in sorted(missing_fields):
+        print(_MISSING_FIELD_MESSAGES[field])
     
-    return True
\ No newline at end of file
+    return not missing_fields
@@ -1,6 +1,174 @@
 # REMOVED FUNCTIONS - DO NOT IMPORT
 # Functions removed due to confusion with stream processing workflows
 
+import atexit
+import json
+import os
+import re
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import cache
+
+try:
+    from bson import ObjectId
+    from pymongo import MongoClient
+except ImportError:  # optional, simple reads go through mongosh without it
+    MongoClient = None
+
+from asp_utils import api_client
+
+# Runs execute_mongodb_commands_bulk() commands
+_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+atexit.register(_EXECUTOR.shutdown)
+
+# mongosh session pools keyed by the database URL they connect to, so bulk commands
+# on one database run in parallel on separate sessions
+_mongodb_pools = {}
+_mongodb_pools_lock = threading.Lock()
+
+# PyMongo clients keyed by database URL, so the TLS handshake happens once per URL
+_mongo_clients = {}
+_mongo_clients_lock = threading.Lock()
+
+# Runs a shell command inside a transaction that is always aborted, so it cannot
+# write. Kept on one line so the mongosh session evaluates it as one statement.
+_SAFE_COMMAND_TEMPLATE = (
+    'session = db.getMongo().startSession(); session.startTransaction(); '
+    'try { result = (%s); print(typeof result === "object" ? JSON.stringify(result) : result); } '
+    'catch (e) { print("Error:", e); throw e; } '
+    'finally { session.abortTransaction(); session.endSession(); }'
+)
+
+# Splits mongodb:// and mongodb+srv:// URLs into host part, database path and query
+_MONGO_URL_RE = re.compile(
+    r'(?P<base>mongodb(?:\+srv)?://[^/?#]+)(?P<path>/[^?#]*)?(?P<query>\?[^#]+)?'
+)
+
+# Read commands simple enough to run through PyMongo instead of mongosh
+_DB_STATS_RE = re.compile(r'db\.stats\(\)')
+_COLLECTION_READ_RE = re.compile(
+    r'db\.(?P<collection>\w+)\.(?P<method>countDocuments|findOne|find)\((?P<filter>.*?)\)'
+    r'(?:\.limit\((?P<limit>\d+)\))?(?P<to_array>\.toArray\(\))?',
+    re.DOTALL
+)
+
+
+def _get_mongodb_pool(database_url: str):
+    """Return the mongosh session pool for the database URL, creating it if needed."""
+    with _mongodb_pools_lock:
+        pool = _mongodb_pools.get(database_url)
+        if pool is None:
+            # Output is returned to the caller only, not echoed
+            pool = api_client.open_mongosh_session_pool([database_url], echo=False)
+            _mongodb_pools[database_url] = pool
+        return pool
+
+
+def _get_mongo_client(database_url: str) -> "MongoClient":
+    """Return the cached PyMongo client for the database URL, creating it if needed."""
+    with _mongo_clients_lock:
+        client = _mongo_clients.get(database_url)
+        if client is None:
+            client = MongoClient(database_url, serverSelectionTimeoutMS=60000)
+            _mongo_clients[database_url] = client
+        return client
+
+
+def _to_json_value(value):
+    """Convert BSON values the way JSON.stringify does in mongosh."""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%dT%H:%M:%S.') + f'{value.microsecond // 1000:03d}Z'
+    return str(value)
+
+
+def _execute_with_pymongo(database_url: str, database: str, command: str):
+    """
+    Run a simple read command in-process through PyMongo.
+    
+    Handles db.stats(), db.X.countDocuments(filter), db.X.findOne(filter) and
+    db.X.find(filter)[.limit(N)].toArray() where the filter is empty or plain
+    JSON. Output is compact plain JSON, as the mongosh path prints with
+    JSON.stringify: ObjectIds become hex strings and dates ISO strings.
+    
+    Returns:
+        tuple: (success, stdout, stderr), or None if the command needs mongosh
+            (or PyMongo is not installed)
+    """
+    if MongoClient is None:
+        return None
+    
+    command = command.strip()
+    
+    if _DB_STATS_RE.fullmatch(command):
+        db = _get_mongo_client(database_url)[database]
+        result = db.command('dbstats')
+        return (True, json.dumps(result, separators=(',', ':'), default=_to_json_value) + '\n', '')
+    
+    match = _COLLECTION_READ_RE.fullmatch(command)
+    if match is None:
+        return None
+    
+    method = match.group('method')
+    is_find = method == 'find'
+    if is_find != bool(match.group('to_array')) or (match.group('limit') and not is_find):
+        return None
+    
+    try:
+        query_filter = json.loads(match.group('filter')) if match.group('filter').strip() else {}
+    except json.JSONDecodeError:
+        return None  # JavaScript object literal, let mongosh parse it
+    if not isinstance(query_filter, dict):
+        return None
+    
+    # Only reads match, so unlike the mongosh path no aborted transaction is needed
+    collection = _get_mongo_client(database_url)[database][match.group('collection')]
+    if method == 'countDocuments':
+        return (True, f"{collection.count_documents(query_filter)}\n", '')
+    if method == 'findOne':
+        result = collection.find_one(query_filter)
+    else:
+        cursor = collection.find(query_filter)
+        if match.group('limit'):
+            cursor = cursor.limit(int(match.group('limit')))
+        result = list(cursor)
+    
+    return (True, json.dumps(result, separators=(',', ':'), default=_to_json_value) + '\n', '')
+
+
+@cache
+def _compose_database_url(mongodb_url: str, database: str) -> str:
+    """Return the URL that connects straight to database."""
+    match = _MONGO_URL_RE.match(mongodb_url)
+    
+    # Legacy handling for non-mongodb:// URLs - ensure URL ends with exactly one slash
+    if match is None:
+        if not mongodb_url.endswith('/'):
+            mongodb_url += '/'
+        return f"{mongodb_url}{database}"
+    
+    base, path, query = match.group('base', 'path', 'query')
+    
+    # If no database in path or path is just '/', add the database
+    if not path or path == '/':
+        return f"{base}/{database}{query or ''}"
+    
+    # Database already specified in URL, use as-is
+    return mongodb_url
+
+
+def _url_database(database_url: str, default: str) -> str:
+    """Return the database a composed URL connects to; a database already in the URL wins."""
+    match = _MONGO_URL_RE.match(database_url)
+    path = match.group('path') if match else None
+    if not path or path == '/':
+        return default
+    return path.strip('/')
+
+
 def execute_mongodb_command(
     mongodb_url: str,
     database: str,
@@ -18,65 +186,28 @@ def execute_mongodb_command(
     Returns:
         tuple: (success, stdout, stderr)
     """
-    import subprocess
-    from urllib.parse import urlparse
-    
-    # For mongodb+srv URLs, we connect to the URL directly and specify database in the command
-    # For other URLs, we might need to append the database
-    if mongodb_url.startswith('mongodb+srv://') or mongodb_url.startswith('mongodb://'):
-        full_url = mongodb_url
-    else:
-        # Legacy handling - ensure URL ends with exactly one slash
-        if not mongodb_url.endswith('/'):
-            mongodb_url += '/'
-        full_url = f"{mongodb_url}{database}"
-    
     # Wrap command in an aborted transaction for safety (prevents any writes)
-    # Connect directly to the database and execute command without "use" statement
-    safe_command = f"""
-    session = db.getMongo().startSession();
-    session.startTransaction();
-    try {{
-        result = ({command});
-        print(typeof result === 'object' ? JSON.stringify(result) : result);
-    }} catch (e) {{
-        print('Error:', e);
-        throw e;
-    }} finally {{
-        session.abortTransaction();
-        session.endSession();
-    }}
-    """
-    
-    # Build mongosh command - connect directly to database to avoid "switched to db" message
-    # For mongodb+srv URLs, append the database name if not already present
-    if mongodb_url.startswith('mongodb+srv://') or mongodb_url.startswith('mongodb://'):
-        # Parse the URL to check if database is already specified
-        parsed = urlparse(mongodb_url)
-        
-        # If no database in path or path is just '/', add the database
-        if not parsed.path or parsed.path == '/':
-            if parsed.query:
-                database_url = f"{parsed.scheme}://{parsed.netloc}/{database}?{parsed.query}"
-            else:
-                database_url = f"{parsed.scheme}://{parsed.netloc}/{database}"
-        else:
-            # Database already specified in URL, use as-is but connect to specified database
-            database_url = mongodb_url
-    else:
-        database_url = full_url
+    safe_command = _SAFE_COMMAND_TEMPLATE % command
     
-    mongosh_cmd = [
-        'mongosh',
-        database_url,
-        '--eval', safe_command
-    ]
+    # Connect directly to the database to avoid the "switched to db" message
+    database_url = _compose_database_url(mongodb_url, database)
     
     try:
         print(f"Executing MongoDB command on {database}: {command}")
-        result = subprocess.run(mongosh_cmd, capture_output=True, text=True, timeout=60)
         
-        return (result.returncode == 0, result.stdout, result.stderr)
+        # Simple reads skip mongosh entirely
+        # Query the database mongosh would connect to, which may be named in the URL
+        result = _execute_with_pymongo(database_url, _url_database(database_url, database), command)
+        if result is not None:
+            return result
+        
+        # Reuse pooled mongosh processes per database URL instead of spawning one per command
+        pool = _get_mongodb_pool(database_url)
+        session = pool.acquire()
+        try:
+            return session.eval(safe_command, timeout=60)
+        finally:
+            pool.release(session)
         
     except subprocess.TimeoutExpired:
         error_msg = f"✗ Timeout executing MongoDB command"
@@ -85,4 +216,17 @@ def execute_mongodb_command(
     except Exception as e:
         error_msg = f"✗ Unexpected error executing MongoDB command: {e}"
         print(error_msg)
-        return (False, "", error_msg)
\ No newline at end of file
+        return (False, "", error_msg)
+
+
+def execute_mongodb_commands_bulk(commands: list) -> list:
+    """
+    Execute several MongoDB shell commands concurrently.
+    
+    Args:
+        commands: (mongodb_url, database, command) tuples
+        
+    Returns:
+        list: (success, stdout, stderr) for each command, in order
+    """
+    return list(_EXECUTOR.map(lambda args: execute_mongodb_command(*args), commands))
@@ -3,109 +3,174 @@
 Unit tests for Atlas CLI authentication functionality.
 """
 
-import unittest
-from unittest.mock import patch, MagicMock
-
-# Add parent directory to path to import asp_utils
-import sys
+import base64
+import json
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import subprocess
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
+from asp_utils import auth
 from asp_utils import check_atlas_auth_with_login
 
+# subprocess.run results; check_atlas_auth_with_login only reads returncode
+_OK = SimpleNamespace(returncode=0)
+_FAIL = SimpleNamespace(returncode=1)
+
 
 class TestCheckAtlasAuthWithLogin(unittest.TestCase):
     """Test cases for check_atlas_auth_with_login function."""
     
+    def setUp(self):
+        # Keep the real Atlas CLI config and auth cache of whoever runs the tests out of the way
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.config_path = os.path.join(self.temp_dir.name, 'config.toml')
+        patcher = patch('asp_utils.auth._ATLAS_CONFIG_PATH', self.config_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.auth_cache_path = Path(self.temp_dir.name) / 'cache' / 'atlas_auth.json'
+        patcher = patch('asp_utils.auth._AUTH_CACHE_PATH', self.auth_cache_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        auth.invalidate_auth_cache()
+        self.addCleanup(auth.invalidate_auth_cache)
+    
+    def _write_config(self, content):
+        with open(self.config_path, 'w') as f:
+            f.write(content)
+    
+    def _write_token_config(self, exp):
+        payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip('=')
+        self._write_config(f'[default]\naccess_token = "header.{payload}.signature"\n')
+    
     @patch('subprocess.run')
     def test_already_authenticated(self, mock_run):
         """Test when user is already authenticated."""
         # Mock successful auth check
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = _OK
         
         result = check_atlas_auth_with_login()
         
         self.assertTrue(result)
         mock_run.assert_called_once_with(
-            ['atlas', 'auth', 'whoami'], 
-            capture_output=True, 
-            text=True, 
+            [auth._ATLAS, 'auth', 'whoami'], 
+            stdout=subprocess.DEVNULL, 
+            stderr=subprocess.DEVNULL, 
             timeout=10
         )
     
-    @patch('builtins.input', return_value='y')
-    @patch('subprocess.run')
-    def test_not_authenticated_user_says_yes_login_succeeds(self, mock_run, mock_input):
-        """Test when user is not authenticated, says yes to login, and login succeeds."""
-        # First call (auth check) fails, second call (login) succeeds
-        mock_run.side_effect = [
-            MagicMock(returncode=1),  # Auth check fails
-            MagicMock(returncode=0)   # Login succeeds
+    def test_not_authenticated_prompt_scenarios(self):
+        """Test the login prompt answers against the outcome of the login itself."""
+        scenarios = [
+            # (input, results of whoami then login, expected result)
+            ('y', [_FAIL, _OK], True),
+            ('n', [_FAIL], False),
+            ('', [_FAIL, _OK], True),  # Empty input defaults to yes
+            (' Yes ', [_FAIL, _OK], True),  # Case and surrounding spaces are ignored
+            ('y', [_FAIL, _FAIL], False),  # Login fails
         ]
         
-        result = check_atlas_auth_with_login()
-        
-        self.assertTrue(result)
-        self.assertEqual(mock_run.call_count, 2)
-        mock_input.assert_called_once()
+        with patch('subprocess.run') as mock_run, patch('builtins.input') as mock_input:
+            for input_value, results, expected in scenarios:
+                with self.subTest(input=input_value, results=results):
+                    auth.invalidate_auth_cache()
+                    mock_run.reset_mock()
+                    mock_run.side_effect = results
+                    mock_input.reset_mock()
+                    mock_input.return_value = input_value
+                    
+                    result = check_atlas_auth_with_login()
+                    
+                    self.assertEqual(result, expected)
+                    self.assertEqual(mock_run.call_count, len(results))
+                    mock_input.assert_called_once()
     
-    @patch('builtins.input', return_value='n')
+    @patch('builtins.input', side_effect=KeyboardInterrupt)
     @patch('subprocess.run')
-    def test_not_authenticated_user_says_no(self, mock_run, mock_input):
-        """Test when user is not authenticated and says no to login."""
-        # Auth check fails
-        mock_run.return_value = MagicMock(returncode=1)
+    def test_keyboard_interrupt(self, mock_run, mock_input):
+        """Test when user interrupts with Ctrl+C."""
+        mock_run.return_value = _FAIL
         
         result = check_atlas_auth_with_login()
         
         self.assertFalse(result)
-        mock_run.assert_called_once()
-        mock_input.assert_called_once()
     
-    @patch('builtins.input', return_value='')  # Empty input (should default to yes)
+    @patch('subprocess.run', side_effect=Exception("Network error"))
+    def test_auth_check_exception(self, mock_run):
+        """Test when auth check raises an exception."""
+        result = check_atlas_auth_with_login()
+        
+        self.assertFalse(result)
+
+    
     @patch('subprocess.run')
-    def test_not_authenticated_empty_input_login_succeeds(self, mock_run, mock_input):
-        """Test when user gives empty input (defaults to yes) and login succeeds."""
-        mock_run.side_effect = [
-            MagicMock(returncode=1),  # Auth check fails
-            MagicMock(returncode=0)   # Login succeeds
-        ]
+    def test_cached_while_config_unchanged(self, mock_run):
+        """Test that the CLI is only asked again once its config file changes."""
+        mock_run.return_value = _OK
+        self._write_config('[default]\npublic_api_key = "key"\n')
         
-        result = check_atlas_auth_with_login()
+        self.assertTrue(check_atlas_auth_with_login())
+        self.assertTrue(check_atlas_auth_with_login())
+        mock_run.assert_called_once()
         
-        self.assertTrue(result)
+        self._write_config('[default]\npublic_api_key = "changed-key"\n')
+        
+        self.assertTrue(check_atlas_auth_with_login())
         self.assertEqual(mock_run.call_count, 2)
     
-    @patch('builtins.input', return_value='y')
     @patch('subprocess.run')
-    def test_not_authenticated_login_fails(self, mock_run, mock_input):
-        """Test when user says yes to login but login fails."""
-        mock_run.side_effect = [
-            MagicMock(returncode=1),  # Auth check fails
-            MagicMock(returncode=1)   # Login fails
-        ]
+    def test_cached_across_runs(self, mock_run):
+        """Test that a confirmed check is reused by a later process until it expires."""
+        mock_run.return_value = _OK
+        self._write_config('[default]\npublic_api_key = "key"\n')
         
-        result = check_atlas_auth_with_login()
+        self.assertTrue(check_atlas_auth_with_login())
+        self.assertTrue(self.auth_cache_path.exists())
         
-        self.assertFalse(result)
+        # Simulate a fresh process: only the file cache survives
+        auth._auth_cache = None
+        self.assertTrue(check_atlas_auth_with_login())
+        mock_run.assert_called_once()
+        
+        auth._auth_cache = None
+        with patch('time.time', return_value=time.time() + auth._AUTH_CACHE_TTL + 1):
+            self.assertTrue(check_atlas_auth_with_login())
         self.assertEqual(mock_run.call_count, 2)
     
-    @patch('builtins.input', side_effect=KeyboardInterrupt)
     @patch('subprocess.run')
-    def test_keyboard_interrupt(self, mock_run, mock_input):
-        """Test when user interrupts with Ctrl+C."""
-        mock_run.return_value = MagicMock(returncode=1)
+    def test_unexpired_access_token_skips_cli(self, mock_run):
+        """Test that a valid access token in the CLI config needs no subprocess."""
+        self._write_token_config(time.time() + 3600)
         
-        result = check_atlas_auth_with_login()
+        self.assertTrue(check_atlas_auth_with_login())
+        mock_run.assert_not_called()
+    
+    @patch('builtins.input', return_value='n')
+    @patch('subprocess.run')
+    def test_expired_access_token_asks_cli(self, mock_run, mock_input):
+        """Test that an expired access token falls back to the CLI check."""
+        mock_run.return_value = _FAIL
+        self._write_token_config(time.time() - 60)
         
-        self.assertFalse(result)
+        self.assertFalse(check_atlas_auth_with_login())
+        mock_run.assert_called_once()
     
-    @patch('subprocess.run', side_effect=Exception("Network error"))
-    def test_auth_check_exception(self, mock_run):
-        """Test when auth check raises an exception."""
-        result = check_atlas_auth_with_login()
+    @patch('builtins.input', side_effect=lambda prompt: time.sleep(1))
+    @patch('subprocess.run')
+    def test_unanswered_prompt_declines_login(self, mock_run, mock_input):
+        """Test that no answer within the timeout declines instead of starting a login."""
+        mock_run.return_value = _FAIL  # Auth check fails
+        
+        result = check_atlas_auth_with_login(timeout=0.05)
         
         self.assertFalse(result)
+        mock_run.assert_called_once()
 
 
 if __name__ == '__main__':
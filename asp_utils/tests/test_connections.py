@@ -4,142 +4,226 @@ Unit tests for connection creation functionality.
 """
 
 import unittest
-from unittest.mock import patch, mock_open, MagicMock
+from unittest.mock import patch, MagicMock
 import subprocess
-
-# Add parent directory to path to import asp_utils
-import sys
+import json
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from asp_utils import create_kafka_connection, create_mongodb_connection
+from asp_utils import api_client
+from asp_utils import create_kafka_connection, create_mongodb_connection, create_kafka_connections_bulk
+
+
+def _record_stdin(mock_run):
+    """Make a mocked subprocess.run keep each config piped to its stdin."""
+    payloads = []
+    
+    def run(cmd, stdin=None, **kwargs):
+        payloads.append(os.read(stdin, 65536))
+        return mock_run.return_value
+    
+    mock_run.side_effect = run
+    return payloads
 
 
 class TestCreateKafkaConnection(unittest.TestCase):
     """Test cases for create_kafka_connection function."""
     
-    @patch('os.path.exists', return_value=True)
-    @patch('os.remove')
-    @patch('subprocess.run')
-    def test_create_connection_success(self, mock_run, mock_remove, mock_exists):
+    def setUp(self):
+        api_client._SEEN_CONNECTIONS.clear()
+        self.addCleanup(api_client._SEEN_CONNECTIONS.clear)
+        
+        # One patcher per test instead of a decorator on each
+        patcher = patch('subprocess.run')
+        self.mock_run = patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_create_connection_success(self):
         """Test successful Kafka connection creation."""
-        mock_run.return_value = MagicMock(returncode=0)
-        
-        with patch('builtins.open', mock_open()) as mock_file:
-            result = create_kafka_connection(
-                "test-group-id",
-                "test-tenant",
-                "test-connection",
-                "https://test-endpoint.com:443",
-                "test-api-key",
-                "test-api-secret"
-            )
+        self.mock_run.return_value = MagicMock(returncode=0)
+        stdin_payloads = _record_stdin(self.mock_run)
+        
+        result = create_kafka_connection(
+            "test-group-id",
+            "test-tenant",
+            "test-connection",
+            "https://test-endpoint.com:443",
+            "test-api-key",
+            "test-api-secret"
+        )
         
         self.assertEqual(result, (True, True))
-        mock_run.assert_called_once()
-        mock_file.assert_called_once()
+        self.mock_run.assert_called_once()
+        
+        # Config is passed on stdin instead of through a temporary file
+        args = self.mock_run.call_args[0][0]
+        self.assertEqual(args[args.index('--file') + 1], '/dev/stdin')
+        config = json.loads(stdin_payloads[-1])
+        self.assertEqual(config['bootstrapServers'], 'test-endpoint.com:9092')
+        self.assertEqual(config['authentication']['username'], 'test-api-key')
+        self.assertEqual(config['config']['group.id'], 'test-connection-consumer-group')
     
-    @patch('os.path.exists', return_value=True)
-    @patch('os.remove')
-    @patch('subprocess.run')
-    def test_create_connection_already_exists(self, mock_run, mock_remove, mock_exists):
+    def test_bootstrap_servers_from_other_endpoints(self):
+        """Test that any scheme or port on the REST endpoint, or none, maps to port 9092."""
+        self.mock_run.return_value = MagicMock(returncode=0)
+        stdin_payloads = _record_stdin(self.mock_run)
+        
+        for endpoint in ("https://test-endpoint.com", "http://test-endpoint.com:8443/",
+                         "test-endpoint.com:443", "test-endpoint.com"):
+            api_client._SEEN_CONNECTIONS.clear()
+            create_kafka_connection(
+                "test-group-id", "test-tenant", "test-connection",
+                endpoint, "test-api-key", "test-api-secret"
+            )
+            config = json.loads(stdin_payloads[-1])
+            self.assertEqual(config['bootstrapServers'], 'test-endpoint.com:9092')
+    
+    def test_repeat_call_skips_cli(self):
+        """Test that a connection already handled in this run is not created again."""
+        self.mock_run.return_value = MagicMock(returncode=0)
+        args = ("test-group-id", "test-tenant", "test-connection",
+                "https://test-endpoint.com:443", "test-api-key", "test-api-secret")
+        
+        self.assertEqual(create_kafka_connection(*args), (True, True))
+        self.assertEqual(create_kafka_connection(*args), (True, False))
+        self.mock_run.assert_called_once()
+    
+    def test_create_connection_already_exists(self):
         """Test when connection already exists."""
-        mock_run.return_value = MagicMock(
+        self.mock_run.return_value = MagicMock(
             returncode=1, 
-            stderr="Connection already exists"
+            stderr=b"Connection already exists"
         )
         
-        with patch('builtins.open', mock_open()) as mock_file:
-            result = create_kafka_connection(
-                "test-group-id",
-                "test-tenant",
-                "test-connection",
-                "https://test-endpoint.com:443",
-                "test-api-key",
-                "test-api-secret"
-            )
+        result = create_kafka_connection(
+            "test-group-id",
+            "test-tenant",
+            "test-connection",
+            "https://test-endpoint.com:443",
+            "test-api-key",
+            "test-api-secret"
+        )
         
         self.assertEqual(result, (True, False))
     
-    @patch('os.path.exists', return_value=True)
-    @patch('os.remove')
-    @patch('subprocess.run')
-    def test_create_connection_failure(self, mock_run, mock_remove, mock_exists):
+    def test_create_connection_duplicate_any_case(self):
+        """Test that duplicate errors are recognized regardless of case."""
+        self.mock_run.return_value = MagicMock(
+            returncode=1, 
+            stderr=b"Error: DUPLICATE connection name"
+        )
+        
+        result = create_kafka_connection(
+            "test-group-id",
+            "test-tenant",
+            "test-connection",
+            "https://test-endpoint.com:443",
+            "test-api-key",
+            "test-api-secret"
+        )
+        
+        self.assertEqual(result, (True, False))
+    
+    def test_create_connection_failure(self):
         """Test connection creation failure."""
-        mock_run.return_value = MagicMock(
+        self.mock_run.return_value = MagicMock(
             returncode=1, 
-            stderr="Some other error"
+            stderr=b"Some other error"
         )
         
-        with patch('builtins.open', mock_open()) as mock_file:
-            result = create_kafka_connection(
-                "test-group-id",
-                "test-tenant",
-                "test-connection",
-                "https://test-endpoint.com:443",
-                "test-api-key",
-                "test-api-secret"
-            )
+        result = create_kafka_connection(
+            "test-group-id",
+            "test-tenant",
+            "test-connection",
+            "https://test-endpoint.com:443",
+            "test-api-key",
+            "test-api-secret"
+        )
         
         self.assertEqual(result, (False, False))
     
-    @patch('subprocess.run', side_effect=subprocess.TimeoutExpired(['atlas'], 30))
-    def test_create_connection_timeout(self, mock_run):
+    def test_create_connection_timeout(self):
         """Test connection creation timeout."""
-        with patch('builtins.open', mock_open()):
-            result = create_kafka_connection(
-                "test-group-id",
-                "test-tenant",
-                "test-connection",
-                "https://test-endpoint.com:443",
-                "test-api-key",
-                "test-api-secret"
-            )
+        self.mock_run.side_effect = subprocess.TimeoutExpired(['atlas'], 30)
+        
+        result = create_kafka_connection(
+            "test-group-id",
+            "test-tenant",
+            "test-connection",
+            "https://test-endpoint.com:443",
+            "test-api-key",
+            "test-api-secret"
+        )
         
         self.assertEqual(result, (False, False))
 
 
+class TestCreateKafkaConnectionsBulk(unittest.TestCase):
+    """Test cases for create_kafka_connections_bulk function."""
+    
+    @patch('asp_utils.api_client.create_kafka_connection')
+    def test_results_in_spec_order(self, mock_create):
+        """Test that every spec is created and results keep the spec order."""
+        mock_create.side_effect = lambda group, tenant, name, endpoint, key, secret: (name != "bad", name == "new")
+        specs = [
+            ("group", "tenant", name, "https://test-endpoint.com:443", "key", "secret")
+            for name in ("new", "bad", "existing")
+        ]
+        
+        result = create_kafka_connections_bulk(specs)
+        
+        self.assertEqual(result, [(True, True), (False, False), (True, False)])
+        self.assertEqual(mock_create.call_count, 3)
+
+
 class TestCreateMongoDBConnection(unittest.TestCase):
     """Test cases for create_mongodb_connection function."""
     
-    @patch('os.path.exists', return_value=True)
-    @patch('os.remove')
-    @patch('subprocess.run')
-    def test_create_mongodb_connection_success(self, mock_run, mock_remove, mock_exists):
+    def setUp(self):
+        api_client._SEEN_CONNECTIONS.clear()
+        self.addCleanup(api_client._SEEN_CONNECTIONS.clear)
+        
+        # One patcher per test instead of a decorator on each
+        patcher = patch('subprocess.run')
+        self.mock_run = patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_create_mongodb_connection_success(self):
         """Test successful MongoDB connection creation."""
-        mock_run.return_value = MagicMock(returncode=0)
-        
-        with patch('builtins.open', mock_open()) as mock_file:
-            result = create_mongodb_connection(
-                "test-group-id",
-                "test-tenant",
-                "test-cluster",
-                "test-connection",
-                "readAnyDatabase"
-            )
+        self.mock_run.return_value = MagicMock(returncode=0)
+        stdin_payloads = _record_stdin(self.mock_run)
+        
+        result = create_mongodb_connection(
+            "test-group-id",
+            "test-tenant",
+            "test-cluster",
+            "test-connection",
+            "readAnyDatabase"
+        )
         
         self.assertEqual(result, (True, True))
-        mock_run.assert_called_once()
-        mock_file.assert_called_once()
+        self.mock_run.assert_called_once()
+        
+        # Config is passed on stdin instead of through a temporary file
+        args = self.mock_run.call_args[0][0]
+        self.assertEqual(args[args.index('--file') + 1], '/dev/stdin')
+        config = json.loads(stdin_payloads[-1])
+        self.assertEqual(config['clusterName'], 'test-cluster')
+        self.assertEqual(config['dbRoleToExecute'], {'role': 'readAnyDatabase', 'type': 'BUILT_IN'})
     
-    @patch('os.path.exists', return_value=True)
-    @patch('os.remove')
-    @patch('subprocess.run')
-    def test_create_mongodb_connection_already_exists(self, mock_run, mock_remove, mock_exists):
+    def test_create_mongodb_connection_already_exists(self):
         """Test when MongoDB connection already exists."""
-        mock_run.return_value = MagicMock(
+        self.mock_run.return_value = MagicMock(
             returncode=1, 
-            stderr="Connection already exists"
+            stderr=b"Connection already exists"
         )
         
-        with patch('builtins.open', mock_open()) as mock_file:
-            result = create_mongodb_connection(
-                "test-group-id",
-                "test-tenant",
-                "test-cluster",
-                "test-connection",
-                "readWriteAnyDatabase"
-            )
+        result = create_mongodb_connection(
+            "test-group-id",
+            "test-tenant",
+            "test-cluster",
+            "test-connection",
+            "readWriteAnyDatabase"
+        )
         
         self.assertEqual(result, (True, False))
 
@@ -3,63 +3,99 @@
 Unit tests for JSON file loading functionality.
 """
 
+import io
 import unittest
 import tempfile
 import os
 import json
+from pathlib import Path
+from unittest.mock import patch
 
-# Add parent directory to path to import asp_utils
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
-from asp_utils import load_json_file
+from asp_utils import load_json_file, load_json_files, list_json_files
 
 
 class TestLoadJsonFile(unittest.TestCase):
     """Test cases for load_json_file function."""
     
     def test_load_valid_json(self):
-        """Test loading a valid JSON file."""
+        """Test loading valid JSON."""
         test_data = {"test": "data", "number": 123}
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(test_data, f)
-            temp_file = f.name
-        
-        try:
-            result = load_json_file(temp_file)
-            self.assertEqual(result, test_data)
-        finally:
-            os.unlink(temp_file)
+        result = load_json_file(io.BytesIO(json.dumps(test_data).encode()))
+        self.assertEqual(result, test_data)
     
     def test_load_nonexistent_file(self):
         """Test loading a file that doesn't exist."""
         result = load_json_file("/nonexistent/file.json")
         self.assertIsNone(result)
     
+    def test_error_names_full_path(self):
+        """Test that errors for a Path print the whole path, not just the file name."""
+        missing = Path("/nonexistent") / "file.json"
+        with patch('sys.stdout', new_callable=io.StringIO) as mock_stdout:
+            self.assertIsNone(load_json_file(missing))
+        self.assertIn(f"File not found: {missing}", mock_stdout.getvalue())
+    
     def test_load_invalid_json(self):
-        """Test loading a file with invalid JSON."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write('{"invalid": json}')  # Missing quotes around 'json'
-            temp_file = f.name
-        
-        try:
-            result = load_json_file(temp_file)
-            self.assertIsNone(result)
-        finally:
-            os.unlink(temp_file)
+        """Test loading invalid JSON."""
+        result = load_json_file(io.BytesIO(b'{"invalid": json}'))  # Missing quotes around 'json'
+        self.assertIsNone(result)
     
     def test_load_empty_file(self):
         """Test loading an empty file."""
+        result = load_json_file(io.BytesIO(b''))
+        self.assertIsNone(result)
+    
+    def test_load_cached_until_file_changes(self):
+        """Test that each load returns a fresh object and a changed file is reloaded."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump({"version": 1}, f)
             temp_file = f.name
         
         try:
-            result = load_json_file(temp_file)
-            self.assertIsNone(result)
+            first = load_json_file(temp_file)
+            first["version"] = 2
+            self.assertEqual(load_json_file(temp_file), {"version": 1})
+            
+            with open(temp_file, 'w') as f:
+                json.dump({"version": 22}, f)
+            
+            self.assertEqual(load_json_file(temp_file), {"version": 22})
         finally:
             os.unlink(temp_file)
 
+    
+    def test_load_many_files_in_order(self):
+        """Test that several files load concurrently with results in path order."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = []
+            for i in range(5):
+                path = os.path.join(temp_dir, f"config_{i}.json")
+                with open(path, 'w') as f:
+                    json.dump({"index": i}, f)
+                paths.append(path)
+            paths.append(os.path.join(temp_dir, "missing.json"))
+            
+            result = load_json_files(paths)
+        
+        self.assertEqual(result, [{"index": i} for i in range(5)] + [None])
+
+
+class TestListJsonFiles(unittest.TestCase):
+    """Test cases for list_json_files function."""
+    
+    def test_only_json_files_listed(self):
+        """Test that other files and directories named *.json are skipped."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ("a.json", "b.json", "notes.txt"):
+                with open(os.path.join(temp_dir, name), 'w') as f:
+                    f.write("{}")
+            os.mkdir(os.path.join(temp_dir, "nested.json"))
+            
+            result = list_json_files(temp_dir)
+        
+        self.assertEqual(sorted(path.name for path in result), ["a.json", "b.json"])
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
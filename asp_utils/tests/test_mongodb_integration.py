@@ -8,14 +8,10 @@ To run these tests, create a mongodb_test_config.json file with your MongoDB cre
 
 import unittest
 import json
-import os
 from pathlib import Path
 
-# Add parent directory to path to import asp_utils
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
-from asp_utils import execute_mongodb_command
+from asp_utils.ignore import removed_functions
+from asp_utils.ignore.removed_functions import execute_mongodb_command
 
 
 class TestMongoDBIntegration(unittest.TestCase):
@@ -51,6 +47,17 @@ class TestMongoDBIntegration(unittest.TestCase):
             cls.skip_tests = True
             cls.skip_reason = f"Error loading config: {e}"
     
+    @classmethod
+    def tearDownClass(cls):
+        """Close the mongosh sessions and MongoClient shared by every test in the class."""
+        for pool in removed_functions._mongodb_pools.values():
+            pool.close()
+        removed_functions._mongodb_pools.clear()
+        
+        for client in removed_functions._mongo_clients.values():
+            client.close()
+        removed_functions._mongo_clients.clear()
+    
     def setUp(self):
         """Skip tests if configuration is not available."""
         if self.skip_tests:
@@ -94,6 +101,18 @@ class TestMongoDBIntegration(unittest.TestCase):
         # Should return an array
         self.assertTrue(stdout.strip().startswith('['), 
                        f"Expected array result, got: {stdout}")
+    
+    def test_shell_commands_share_one_session(self):
+        """Test that commands needing mongosh reuse one persistent session."""
+        for _ in range(2):
+            success, stdout, stderr = execute_mongodb_command(
+                self.config["mongodb-url"],
+                self.config["database"],
+                "db.getCollectionNames()"
+            )
+            self.assertTrue(success, f"Failed to list collections: {stderr}")
+        
+        self.assertEqual(len(removed_functions._mongodb_pools), 1)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Unit tests for stream processing JavaScript execution.
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import textwrap
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock
+
+from asp_utils import api_client
+from asp_utils import (
+    execute_stream_processing_javascript,
+    sp_create_stream_processor,
+    sp_start_processor,
+    sp_stop_processor,
+    create_stream_processors_bulk,
+    create_stream_processors_batch,
+    serialize_pipeline,
+    create_simple_mongodb_to_kafka_topic_pipeline,
+    create_simple_kafka_topic_to_mongodb_pipeline,
+    build_mongodb_to_kafka_topic_pipeline_json,
+    build_kafka_topic_to_mongodb_pipeline_json
+)
+
+
+class TestExecuteStreamProcessingJavascript(unittest.TestCase):
+    """Test cases for execute_stream_processing_javascript function."""
+
+    def setUp(self):
+        api_client._mongosh_pools.clear()
+        self.addCleanup(api_client._mongosh_pools.clear)
+
+    @patch('asp_utils.api_client._MongoshSession')
+    def test_session_reused_across_calls(self, mock_session_class):
+        """Test that one mongosh session serves repeated commands."""
+        session = mock_session_class.return_value
+        session.is_alive.return_value = True
+        session.eval.return_value = (True, "ok\n", "")
+
+        for _ in range(3):
+            result = execute_stream_processing_javascript(
+                "test-user", "test-password", "mongodb://test-url", "sp.listStreamProcessors()"
+            )
+            self.assertEqual(result, (True, "ok\n", ""))
+
+        mock_session_class.assert_called_once()
+        self.assertEqual(session.eval.call_count, 3)
+
+        # URL is normalized to end with a slash before connecting
+        mongosh_args = mock_session_class.call_args[0][0]
+        self.assertEqual(mongosh_args[0], "mongodb://test-url/")
+        self.assertIn("test-user", mongosh_args)
+
+    @patch('asp_utils.api_client._MongoshSession')
+    def test_dead_session_replaced(self, mock_session_class):
+        """Test that a session whose mongosh process exited is restarted."""
+        dead_session = MagicMock()
+        dead_session.is_alive.return_value = False
+        dead_session.eval.return_value = (False, "", "")
+        live_session = MagicMock()
+        live_session.is_alive.return_value = True
+        live_session.eval.return_value = (True, "", "")
+        mock_session_class.side_effect = [dead_session, live_session]
+
+        execute_stream_processing_javascript("user", "pass", "mongodb://test-url/", "sp.a()")
+        result = execute_stream_processing_javascript("user", "pass", "mongodb://test-url/", "sp.b()")
+
+        self.assertEqual(result, (True, "", ""))
+        self.assertEqual(mock_session_class.call_count, 2)
+        live_session.eval.assert_called_once_with("sp.b()", timeout=300, echo=True)
+
+    @patch('asp_utils.api_client._MongoshSession')
+    def test_parallel_sessions_bounded(self, mock_session_class):
+        """Test that parallel commands share a bounded number of sessions."""
+        def slow_eval(*args, **kwargs):
+            time.sleep(0.01)
+            return (True, "", "")
+
+        def new_session(mongosh_args, echo=True):
+            session = MagicMock()
+            session.is_alive.return_value = True
+            session.eval.side_effect = slow_eval
+            return session
+        mock_session_class.side_effect = new_session
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(
+                lambda _: execute_stream_processing_javascript("user", "pass", "mongodb://test-url/", "sp.a()"),
+                range(64)
+            ))
+
+        self.assertTrue(all(success for success, _, _ in results))
+        self.assertLessEqual(mock_session_class.call_count, api_client._MONGOSH_POOL_SIZE)
+
+    @patch('asp_utils.api_client._MongoshSession', side_effect=OSError("mongosh not found"))
+    def test_session_start_failure(self, mock_session_class):
+        """Test that failing to start mongosh is reported, not raised."""
+        success, stdout, stderr = execute_stream_processing_javascript(
+            "user", "pass", "mongodb://test-url/", "sp.a()"
+        )
+
+        self.assertFalse(success)
+        self.assertIn("mongosh not found", stderr)
+
+
+# Stands in for mongosh, following the session's line protocol: the failure flag line,
+# the try block (skipped, like mongosh does, if the command has a syntax error), and the
+# status and sentinel line. For commands that throw, stderr noise is written only after
+# the sentinel.
+_FAKE_MONGOSH = textwrap.dedent('''\
+    import re
+    import sys
+    import time
+
+    failed = False
+    body = None
+    late_stderr = False
+    for line in sys.stdin:
+        if line.strip() == "exit":
+            break
+        if line.startswith("var __aspFailed = true;"):
+            failed = True
+        elif line.startswith("try {"):
+            body = []
+        elif line.startswith(";var __aspFailed = false;"):
+            code = "".join(body)
+            body = None
+            if "syntax error" in code:
+                print("SyntaxError: Unexpected identifier", file=sys.stderr, flush=True)
+            elif "throw" in code:
+                error_prefix = re.search(r'print\\("(__ASP_ERROR__\\d+ )"', line).group(1)
+                print(error_prefix + '"Error: boom"')
+                late_stderr = True
+            else:
+                print("result")
+                failed = False
+        elif body is not None:
+            body.append(line)
+        else:
+            failed_status, ok_status, sentinel = re.findall(r'"(__ASP_\\w+__\\d+)"', line)
+            print(failed_status if failed else ok_status)
+            print(sentinel, flush=True)
+            if late_stderr:
+                time.sleep(0.2)
+                print("late stderr noise", file=sys.stderr, flush=True)
+                late_stderr = False
+''')
+
+
+class TestMongoshSessionProtocol(unittest.TestCase):
+    """Test _MongoshSession against a fake mongosh process."""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        fake_mongosh = os.path.join(temp_dir.name, 'mongosh')
+        with open(fake_mongosh, 'w') as f:
+            f.write(f"#!{sys.executable}\n{_FAKE_MONGOSH}")
+        os.chmod(fake_mongosh, 0o755)
+
+        patcher = patch('asp_utils.api_client._MONGOSH', fake_mongosh)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Keep the echoed output out of the test run
+        for stream in ('stdout', 'stderr'):
+            patcher = patch(f'sys.{stream}', io.StringIO())
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.session = api_client._MongoshSession([])
+        self.addCleanup(self.session.close)
+
+    def test_status_read_from_stdout(self):
+        """Test that a failure is reported on its own command, not on the next one."""
+        success, stdout, stderr = self.session.eval("throw new Error('boom')", timeout=10)
+        self.assertFalse(success)
+        self.assertEqual(stdout, "")
+        self.assertEqual(stderr, "Error: boom\n")
+
+        # The failed command's stderr arrives while this one runs
+        success, stdout, _ = self.session.eval("sp.listStreamProcessors()", timeout=10)
+        self.assertTrue(success)
+        self.assertEqual(stdout, "result\n")
+
+    def test_syntax_error_fails(self):
+        """Test that a command that does not parse fails, on a fresh or a reused session."""
+        self.assertFalse(self.session.eval("syntax error", timeout=10)[0])
+        self.assertTrue(self.session.eval("sp.listStreamProcessors()", timeout=10)[0])
+        self.assertFalse(self.session.eval("syntax error", timeout=10)[0])
+
+    def test_exit_before_sentinel_fails(self):
+        """Test that a command fails when mongosh exits before finishing it."""
+        success, _, _ = self.session.eval("exit", timeout=10)
+        self.assertFalse(success)
+
+
+class TestSpCreateStreamProcessor(unittest.TestCase):
+    """Test cases for sp_create_stream_processor function."""
+
+    @patch('asp_utils.api_client.execute_stream_processing_javascript')
+    def test_create_success(self, mock_execute):
+        """Test successful stream processor creation."""
+        mock_execute.return_value = (True, "", "")
+
+        result = sp_create_stream_processor(
+            "user", "pass", "mongodb://test-url/", "test-processor", [{"$source": {}}]
+        )
+
+        self.assertTrue(result)
+        js_command = mock_execute.call_args[0][3]
+        self.assertTrue(js_command.startswith('sp.createStreamProcessor("test-processor", '))
+
+    @patch('asp_utils.api_client.execute_stream_processing_javascript')
+    def test_create_already_exists(self, mock_execute):
+        """Test that an existing stream processor counts as success."""
+        mock_execute.return_value = (False, "", "MongoServerError: processor already exists")
+
+        result = sp_create_stream_processor(
+            "user", "pass", "mongodb://test-url/", "test-processor", [{"$source": {}}]
+        )
+
+        self.assertTrue(result)
+
+    @patch('asp_utils.api_client.execute_stream_processing_javascript')
+    def test_create_failure(self, mock_execute):
+        """Test stream processor creation failure."""
+        mock_execute.return_value = (False, "", "MongoServerError: invalid pipeline")
+
+        result = sp_create_stream_processor(
+            "user", "pass", "mongodb://test-url/", "test-processor", [{"$source": {}}]
+        )
+
+        self.assertFalse(result)
+
+    @patch('asp_utils.api_client.execute_stream_processing_javascript')
+    def test_create_with_serialized_pipeline(self, mock_execute):
+        """Test that pre-serialized pipeline JSON is passed through unchanged."""
+        mock_execute.return_value = (True, "", "")
+        pipeline_json = serialize_pipeline([{"$source": {"connectionName": "kafka"}}])
+
+        sp_create_stream_processor("user", "pass", "mongodb://test-url/", "test-processor", pipeline_json)
+
+        js_command = mock_execute.call_args[0][3]
+        self.assertEqual(
+            js_command,
+            'sp.createStreamProcessor("test-processor", [{"$source":{"connectionName":"kafka"}}])'
+        )
+
+
+    @patch('asp_utils.api_client.execute_stream_processing_javascript')
+    def test_processor_names_escaped(self, mock_execute):
+        """Test that quotes and backslashes in processor names cannot break out of the JS string."""
+        mock_execute.return_value = (True, "", "")
+        name = 'evil"]; db.dropDatabase(); //\\'
+
+        sp_create_stream_processor("user", "pass", "mongodb://test-url/", name, "[]")
+        sp_start_processor("user", "pass", "mongodb://test-url/", name)
+        sp_stop_processor("user", "pass", "mongodb://test-url/", name)
+
+        js_commands = [call[0][3] for call in mock_execute.call_args_list]
+        self.assertEqual(js_commands, [
+            f'sp.createStreamProcessor({json.dumps(name)}, [])',
+            f'sp[{json.dumps(name)}].start()',
+            f'sp[{json.dumps(name)}].stop()'
+        ])
+
+class TestSerializePipeline(unittest.TestCase):
+    """Test cases for serialize_pipeline function."""
+
+    def test_serialize_list(self):
+        """Test that a pipeline list is serialized compactly."""
+        self.assertEqual(serialize_pipeline([{"$match": {"a": 1}}]), '[{"$match":{"a":1}}]')
+
+    def test_serialized_input_returned_as_str(self):
+        """Test that str and bytes pipeline JSON are reused as-is."""
+        self.assertEqual(serialize_pipeline('[{"$match":{}}]'), '[{"$match":{}}]')
+        self.assertEqual(serialize_pipeline(b'[{"$match":{}}]'), '[{"$match":{}}]')
+
+
+class TestPipelineJsonBuilders(unittest.TestCase):
+    """Test that the JSON pipeline builders match the dict pipeline helpers."""
+
+    def test_mongodb_to_kafka(self):
+        """Test the MongoDB -> Kafka pipeline JSON."""
+        args = ("mongo-conn", "db", 'coll "quoted"', "kafka-conn", "prefix.db.coll")
+
+        self.assertEqual(
+            json.loads(build_mongodb_to_kafka_topic_pipeline_json(*args)),
+            create_simple_mongodb_to_kafka_topic_pipeline(*args)
+        )
+
+    def test_kafka_to_mongodb(self):
+        """Test the Kafka -> MongoDB pipeline JSON with and without an offset reset."""
+        for topics, auto_offset_reset in [("topic", None), (["a", "b"], "earliest")]:
+            with self.subTest(topics=topics, auto_offset_reset=auto_offset_reset):
+                args = ("kafka-conn", topics, "mongo-conn", "db", "coll", auto_offset_reset)
+
+                self.assertEqual(
+                    json.loads(build_kafka_topic_to_mongodb_pipeline_json(*args)),
+                    create_simple_kafka_topic_to_mongodb_pipeline(*args)
+                )
+
+
+class TestCreateStreamProcessorsBulk(unittest.TestCase):
+    """Test cases for create_stream_processors_bulk function."""
+
+    @patch('asp_utils.api_client.sp_create_stream_processor')
+    def test_results_keyed_by_processor(self, mock_create):
+        """Test that every processor is created with its own pipeline."""
+        mock_create.side_effect = lambda user, password, url, name, pipeline: name == "good"
+        processors = {
+            "good": [{"$source": {"db": "a"}}],
+            "bad": [{"$source": {"db": "b"}}]
+        }
+
+        result = create_stream_processors_bulk("user", "pass", "mongodb://test-url/", processors)
+
+        self.assertEqual(result, {"good": True, "bad": False})
+        created = {call[0][3]: call[0][4] for call in mock_create.call_args_list}
+        self.assertEqual(created, processors)
+
+
+
+class TestCreateStreamProcessorsBatch(unittest.TestCase):
+    """Test cases for create_stream_processors_batch function."""
+
+    @patch('asp_utils.api_client.execute_stream_processing_javascript')
+    def test_results_parsed_per_processor(self, mock_execute):
+        """Test that one command creates every processor and results are read back by name."""
+        mock_execute.return_value = (
+            True,
+            'banner\n'
+            '__ASP_RESULT__["created",null]\n'
+            '__ASP_RESULT__["existing","processor already exists"]\n'
+            '__ASP_RESULT__["broken","invalid pipeline"]\n',
+            ""
+        )
+        specs = [
+            ("created", [{"$source": {"db": "a"}}]),
+            ("existing", '[{"$source":{"db":"b"}}]'),
+            ("broken", [{"$source": {}}]),
+            ("missing", [{"$source": {}}])
+        ]
+
+        result = create_stream_processors_batch("user", "pass", "mongodb://test-url/", specs)
+
+        self.assertEqual(result, {"created": True, "existing": True, "broken": False, "missing": False})
+        mock_execute.assert_called_once()
+        js_command = mock_execute.call_args[0][3]
+        self.assertIn('sp.createStreamProcessor("created",[{"$source":{"db":"a"}}])', js_command)
+        self.assertIn('sp.createStreamProcessor("existing",[{"$source":{"db":"b"}}])', js_command)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Kafka topic creation functionality.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import patch, MagicMock
+import requests
+
+from asp_utils import api_client
+from asp_utils import create_topic, create_topics_bulk, create_topics_async
+
+
+class TestCreateTopic(unittest.TestCase):
+    """Test cases for create_topic function."""
+
+    def setUp(self):
+        self.session = MagicMock()
+        patcher = patch('asp_utils.api_client._get_http_session', return_value=self.session)
+        self.mock_get_session = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _create(self, topic_name="test.topic"):
+        return create_topic(
+            "https://test-endpoint.com:443",
+            "test-cluster-id",
+            "test-api-key",
+            "test-api-secret",
+            topic_name
+        )
+
+    def test_create_topic_success(self):
+        """Test successful topic creation."""
+        self.session.post.return_value = MagicMock(status_code=201)
+
+        self.assertTrue(self._create())
+
+        self.mock_get_session.assert_called_once_with("https://test-endpoint.com:443")
+        url = self.session.post.call_args[0][0]
+        self.assertEqual(url, "https://test-endpoint.com:443/kafka/v3/clusters/test-cluster-id/topics")
+        self.assertEqual(self.session.post.call_args[1]['auth'], ("test-api-key", "test-api-secret"))
+        self.assertEqual(self.session.post.call_args[1]['json']['topic_name'], "test.topic")
+
+    def test_create_topic_conflict(self):
+        """Test that an existing topic counts as success."""
+        self.session.post.return_value = MagicMock(status_code=409)
+
+        self.assertTrue(self._create())
+
+    def test_create_topic_already_created_error_code(self):
+        """Test that Confluent error code 40002 counts as success."""
+        self.session.post.return_value = MagicMock(
+            status_code=400,
+            json=MagicMock(return_value={"error_code": 40002})
+        )
+
+        self.assertTrue(self._create())
+
+    def test_create_topic_failure(self):
+        """Test topic creation failure."""
+        self.session.post.return_value = MagicMock(
+            status_code=401,
+            text="Unauthorized",
+            json=MagicMock(return_value={"error_code": 40101})
+        )
+
+        self.assertFalse(self._create())
+
+    def test_create_topic_network_error(self):
+        """Test topic creation when the request fails."""
+        self.session.post.side_effect = requests.exceptions.ConnectionError("unreachable")
+
+        self.assertFalse(self._create())
+
+
+class TestCreateTopicsBulk(unittest.TestCase):
+    """Test cases for create_topics_bulk function."""
+
+    @patch('asp_utils.api_client.create_topic')
+    def test_results_keyed_by_topic(self, mock_create_topic):
+        """Test that every topic is created and reported by name."""
+        mock_create_topic.side_effect = lambda endpoint, cluster, key, secret, name: name != "bad.topic"
+
+        result = create_topics_bulk(
+            "https://test-endpoint.com:443",
+            "test-cluster-id",
+            "test-api-key",
+            "test-api-secret",
+            ["a.topic", "bad.topic", "b.topic"]
+        )
+
+        self.assertEqual(result, {"a.topic": True, "bad.topic": False, "b.topic": True})
+        self.assertEqual(mock_create_topic.call_count, 3)
+
+    @patch('asp_utils.api_client.create_topic')
+    def test_empty_topic_list(self, mock_create_topic):
+        """Test that an empty topic list makes no requests."""
+        result = create_topics_bulk("https://test-endpoint.com:443", "id", "key", "secret", [])
+
+        self.assertEqual(result, {})
+        mock_create_topic.assert_not_called()
+
+
+class TestCreateTopicsAsync(unittest.TestCase):
+    """Test cases for create_topics_async function."""
+
+    @patch('asp_utils.api_client.create_topic')
+    def test_results_keyed_by_topic(self, mock_create_topic):
+        """Test that every topic is created and reported by name."""
+        mock_create_topic.side_effect = lambda endpoint, cluster, key, secret, name: name != "bad.topic"
+
+        result = asyncio.run(create_topics_async(
+            "https://test-endpoint.com:443",
+            "test-cluster-id",
+            "test-api-key",
+            "test-api-secret",
+            ["a.topic", "bad.topic", "b.topic"],
+            concurrency=2
+        ))
+
+        self.assertEqual(result, {"a.topic": True, "bad.topic": False, "b.topic": True})
+        self.assertEqual(mock_create_topic.call_count, 3)
+
+
+class TestHttpSession(unittest.TestCase):
+    """Test cases for the pooled HTTP session."""
+
+    def test_session_cached_per_endpoint(self):
+        """Test that each REST endpoint gets one reusable session."""
+        api_client._get_http_session.cache_clear()
+        self.addCleanup(api_client._get_http_session.cache_clear)
+
+        first = api_client._get_http_session("https://endpoint-a.com")
+        self.assertIs(first, api_client._get_http_session("https://endpoint-a.com"))
+        self.assertIsNot(first, api_client._get_http_session("https://endpoint-b.com"))
+
+
+if __name__ == '__main__':
+    unittest.main()
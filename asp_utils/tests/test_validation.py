@@ -3,12 +3,9 @@
 Unit tests for configuration validation functionality.
 """
 
+import io
 import unittest
-
-# Add parent directory to path to import asp_utils
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from unittest.mock import patch
 
 from asp_utils import validate_main_config
 
@@ -55,6 +52,15 @@ class TestValidateMainConfig(unittest.TestCase):
         result = validate_main_config({})
         self.assertFalse(result)
     
+    def test_all_missing_fields_reported(self):
+        """Test that every missing field is reported, not just the first."""
+        with patch('sys.stdout', new_callable=io.StringIO) as mock_stdout:
+            result = validate_main_config({"confluent-cluster-id": "test-cluster"})
+        
+        self.assertFalse(result)
+        self.assertEqual(mock_stdout.getvalue().count("Error: Missing required field"), 8)
+        self.assertIn("'mongodb-tenant-name'", mock_stdout.getvalue())
+    
     def test_extra_fields_allowed(self):
         """Test that extra fields don't break validation."""
         config_with_extras = {
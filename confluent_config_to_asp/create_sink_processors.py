@@ -33,62 +33,109 @@ Connector config format:
 }
 """
 
-import json
-import os
+import logging
 import sys
-import requests
 import argparse
-import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Union, List, Tuple
 
 # Add parent directory to path to import asp_utils
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
 # Import shared functions
 from asp_utils import (
     load_json_file, 
+    load_json_files,
+    list_json_files,
     create_kafka_connection, 
     check_atlas_auth_with_login, 
     create_mongodb_connection, 
     validate_main_config, 
-    create_stream_processor,
-    create_simple_kafka_topic_to_mongodb_pipeline
+    sp_create_stream_processor,
+    build_kafka_topic_to_mongodb_pipeline_json
 )
 
+# Connectors processed at once; each one is a few network round trips
+_MAX_WORKERS = 16
 
+# Fields every sink connector config must define
+_REQUIRED_CONNECTOR_FIELDS = frozenset({
+    "kafka.api.key",
+    "kafka.api.secret",
+    "input.data.format",
+    "connection.user",
+    "connection.password",
+    "topics",
+    "database",
+    "collection"
+})
 
+# Accepted values of consumer.override.auto.offset.reset
+_AUTO_OFFSET_RESET_VALUES = frozenset({"earliest", "latest"})
 
 
 
+
+# asp_utils messages logged by worker threads, by thread id, while the thread collects them
+_worker_messages: Dict[int, List[str]] = {}
+
+
+def _divert_worker_logs(record: logging.LogRecord) -> bool:
+    """Logging filter that moves asp_utils messages from collecting worker threads out of the output."""
+    messages = _worker_messages.get(record.thread)
+    if messages is None:
+        return True
+    messages.append(record.getMessage())
+    return False
+
+
+def _collecting_logs(func, *args, **kwargs):
+    """
+    Call func on this worker thread, returning (result, messages it logged).
+    
+    The messages are printed later with the rest of the connector's results
+    rather than straight away, so the output of different connectors does
+    not interleave.
+    """
+    thread_id = threading.get_ident()
+    messages = _worker_messages[thread_id] = []
+    try:
+        return func(*args, **kwargs), messages
+    finally:
+        del _worker_messages[thread_id]
+
+
 def validate_connector_config(config: Dict[str, Any], filename: str) -> bool:
-    """Validate a connector configuration file."""
-    required_fields = [
-        "kafka.api.key", 
-        "kafka.api.secret", 
-        "input.data.format",
-        "connection.user", 
-        "connection.password",
-        "topics",
-        "database", 
-        "collection"
-    ]
-    
-    for field in required_fields:
-        if field not in config:
-            print(f"Error: Missing required field '{field}' in {filename}")
-            return False
-    
-    # Validate topics field (can be string or array)
-    topics = config.get("topics")
-    if not isinstance(topics, (str, list)):
+    """Validate a connector configuration file, reporting every missing field."""
+    missing_fields = _REQUIRED_CONNECTOR_FIELDS.difference(config)
+    
+    for field in sorted(missing_fields):
+        print(f"Error: Missing required field '{field}' in {filename}")
+    
+    if missing_fields:
+        return False
+    
+    # Validate topics field (can be string or array); JSON gives exact str/list types
+    topics = config["topics"]
+    topics_type = type(topics)
+    if topics_type is not str and topics_type is not list:
         print(f"Error: 'topics' field must be a string or array in {filename}")
         return False
     
-    if isinstance(topics, list) and len(topics) == 0:
+    if topics_type is list and len(topics) == 0:
         print(f"Error: 'topics' array cannot be empty in {filename}")
         return False
     
+    # Handle optional auto offset reset
+    auto_offset_reset = config.get("consumer.override.auto.offset.reset")
+    if auto_offset_reset and auto_offset_reset not in _AUTO_OFFSET_RESET_VALUES:
+        print(f"✗ Error: auto offset reset must be 'earliest' or 'latest', got '{auto_offset_reset}' in {filename}")
+        return False
+    
     return True
 
 
@@ -99,14 +146,73 @@ def validate_connector_config(config: Dict[str, Any], filename: str) -> bool:
 
 
 
+def process_connector(
+    main_config: Dict[str, Any],
+    connector_config: Dict[str, Any],
+    connections_created: bool
+) -> Tuple[bool, List[str]]:
+    """
+    Create the sink stream processor for one connector config.
+    
+    Runs on a worker thread, so status lines are returned rather than printed
+    to keep the output of different connectors from interleaving.
+    
+    Returns:
+        tuple: (stream_processor_created, messages)
+    """
+    messages = []
+    
+    # Settings from the main config
+    sp_prefix = main_config["stream-processor-prefix"]
+    kafka_conn_name = main_config["kafka-connection-name"]
+    mongo_conn_name = main_config["mongodb-connection-name"]
+    sp_url = main_config["mongodb-stream-processor-instance-url"]
+    
+    # Extract required fields
+    database = connector_config["database"]
+    collection = connector_config["collection"]
+    topics = connector_config["topics"]
+    connection_user = connector_config["connection.user"]
+    connection_password = connector_config["connection.password"]
+    
+    # Optional; its value was checked by validate_connector_config
+    auto_offset_reset = connector_config.get("consumer.override.auto.offset.reset")
+    
+    # Create stream processor if both connections exist
+    if not connections_created:
+        messages.append(f"⚠ Skipping stream processor creation: Required connections not available")
+        return False, messages
+    
+    # Construct stream processor name
+    stream_processor_name = f"{sp_prefix}_{database}_{collection}"
+    
+    # Create sink pipeline (Kafka -> MongoDB)
+    pipeline = build_kafka_topic_to_mongodb_pipeline_json(
+        kafka_conn_name,
+        topics,
+        mongo_conn_name,
+        database,
+        collection,
+        auto_offset_reset
+    )
+    
+    stream_processor_success, sp_messages = _collecting_logs(
+        sp_create_stream_processor,
+        connection_user,
+        connection_password,
+        sp_url,
+        stream_processor_name,
+        pipeline,
+        echo=False
+    )
+    messages.extend(sp_messages)
+    
+    return stream_processor_success, messages
+
+
 def process_connector_configs(main_config: Dict[str, Any], configs_folder: str) -> None:
     """Process all connector configuration files in the specified folder."""
     
-    # Check Atlas CLI authentication first - stop all processing if not authenticated
-    if not check_atlas_auth_with_login():
-        print("✗ All processing stopped due to authentication failure")
-        return
-    
     folder_path = Path(configs_folder)
     
     if not folder_path.exists():
@@ -117,8 +223,18 @@ def process_connector_configs(main_config: Dict[str, Any], configs_folder: str)
         print(f"Error: Path is not a directory: {configs_folder}")
         return
     
-    # Find all .json files in the folder
-    json_files = list(folder_path.glob("*.json"))
+    # Check Atlas CLI authentication in the background while the configs are read
+    with ThreadPoolExecutor(max_workers=1) as auth_executor:
+        auth_future = auth_executor.submit(check_atlas_auth_with_login)
+        
+        # Find all .json files in the folder and read them up front, in parallel
+        json_files = list_json_files(folder_path)
+        connector_configs = load_json_files(json_files)
+    
+    # Stop all processing if not authenticated
+    if not auth_future.result():
+        print("✗ All processing stopped due to authentication failure")
+        return
     
     if not json_files:
         print(f"No .json files found in {configs_folder}")
@@ -127,37 +243,48 @@ def process_connector_configs(main_config: Dict[str, Any], configs_folder: str)
     print(f"Found {len(json_files)} .json files to process")
     print("-" * 50)
     
+    # Settings used throughout, read once
+    mongo_conn_name = main_config["mongodb-connection-name"]
+    group_id = main_config["mongodb-group-id"]
+    tenant_name = main_config["mongodb-tenant-name"]
+    cluster_name = main_config["mongodb-cluster-name"]
+    kafka_conn_name = main_config["kafka-connection-name"]
+    rest_endpoint = main_config["confluent-rest-endpoint"]
+    
     # Create connections once (using first connector config for Kafka auth)
     kafka_connection_created = False
     kafka_connection_was_created = False
     mongodb_connection_created = False
     mongodb_connection_was_created = False
-    first_connector_config = None
     
-    for json_file in json_files:
-        connector_config = load_json_file(str(json_file))
+    # Validate every config once; the first valid one supplies the Kafka credentials
+    valid_connectors = []
+    for json_file, connector_config in zip(json_files, connector_configs):
+        print(f"\nProcessing: {json_file.name}")
+        
         if connector_config and validate_connector_config(connector_config, json_file.name):
-            first_connector_config = connector_config
-            break
+            valid_connectors.append((json_file, connector_config))
+    
+    first_connector_config = valid_connectors[0][1] if valid_connectors else None
     
     # Create MongoDB sink connection
-    print(f"\nCreating MongoDB sink connection: {main_config['mongodb-connection-name']}")
+    print(f"\nCreating MongoDB sink connection: {mongo_conn_name}")
     mongodb_connection_created, mongodb_connection_was_created = create_mongodb_connection(
-        main_config["mongodb-group-id"],
-        main_config["mongodb-tenant-name"],
-        main_config["mongodb-cluster-name"],
-        main_config["mongodb-connection-name"],
+        group_id,
+        tenant_name,
+        cluster_name,
+        mongo_conn_name,
         role_name="readWriteAnyDatabase"  # Sink connections need write access
     )
     
     # Create Kafka connection
     if first_connector_config:
-        print(f"\nCreating Kafka connection: {main_config['kafka-connection-name']}")
+        print(f"\nCreating Kafka connection: {kafka_conn_name}")
         kafka_connection_created, kafka_connection_was_created = create_kafka_connection(
-            main_config["mongodb-group-id"],
-            main_config["mongodb-tenant-name"],
-            main_config["kafka-connection-name"],
-            main_config["confluent-rest-endpoint"],
+            group_id,
+            tenant_name,
+            kafka_conn_name,
+            rest_endpoint,
             first_connector_config["kafka.api.key"],
             first_connector_config["kafka.api.secret"]
         )
@@ -165,73 +292,42 @@ def process_connector_configs(main_config: Dict[str, Any], configs_folder: str)
     stream_processor_success_count = 0
     total_count = len(json_files)
     
-    for json_file in json_files:
-        print(f"\nProcessing: {json_file.name}")
-        
-        # Load connector config
-        connector_config = load_json_file(str(json_file))
-        if not connector_config:
-            continue
-        
-        # Validate connector config
-        if not validate_connector_config(connector_config, json_file.name):
-            continue
-        
-        # Extract required fields
-        database = connector_config["database"]
-        collection = connector_config["collection"]
-        topics = connector_config["topics"]
-        connection_user = connector_config["connection.user"]
-        connection_password = connector_config["connection.password"]
+    # Stream processor creation is network-bound, so run connectors concurrently
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(
+                process_connector,
+                main_config,
+                connector_config,
+                mongodb_connection_created and kafka_connection_created
+            ): json_file
+            for json_file, connector_config in valid_connectors
+        }
         
-        # Handle optional auto offset reset
-        auto_offset_reset = connector_config.get("consumer.override.auto.offset.reset")
-        if auto_offset_reset and auto_offset_reset not in ["earliest", "latest"]:
-            print(f"✗ Error: auto offset reset must be 'earliest' or 'latest', got '{auto_offset_reset}' in {json_file.name}")
-            continue
-        
-        
-        # Create stream processor if both connections exist
-        if mongodb_connection_created and kafka_connection_created:
-            # Construct stream processor name
-            stream_processor_name = f"{main_config['stream-processor-prefix']}_{database}_{collection}"
-            
-            # Create sink pipeline (Kafka -> MongoDB)
-            pipeline = create_simple_kafka_topic_to_mongodb_pipeline(
-                main_config["kafka-connection-name"],
-                topics,
-                main_config["mongodb-connection-name"],
-                database,
-                collection,
-                auto_offset_reset
-            )
+        for future in as_completed(futures):
+            stream_processor_success, messages = future.result()
             
-            stream_processor_success = create_stream_processor(
-                connection_user,
-                connection_password,
-                main_config["mongodb-stream-processor-instance-url"],
-                stream_processor_name,
-                pipeline
-            )
+            # One write per connector rather than one per line
+            if messages:
+                print("\n".join([f"\nResults for {futures[future].name}:", *messages]))
             
-            if stream_processor_success:
-                stream_processor_success_count += 1
-        else:
-            print(f"⚠ Skipping stream processor creation: Required connections not available")
+            stream_processor_success_count += stream_processor_success
     
-    print("-" * 50)
-    print(f"Summary:")
+    # Built up and written in one go
+    summary = ["-" * 50, "Summary:"]
     if mongodb_connection_created:
         connection_status = "created" if mongodb_connection_was_created else "reused (already existed)"
-        print(f"  MongoDB sink connection: 1/1 {connection_status}")
+        summary.append(f"  MongoDB sink connection: 1/1 {connection_status}")
     else:
-        print(f"  MongoDB sink connection: 0/1 created successfully")
+        summary.append(f"  MongoDB sink connection: 0/1 created successfully")
     if kafka_connection_created:
         connection_status = "created" if kafka_connection_was_created else "reused (already existed)"
-        print(f"  Kafka connection: 1/1 {connection_status}")
+        summary.append(f"  Kafka connection: 1/1 {connection_status}")
     else:
-        print(f"  Kafka connection: 0/1 created successfully")
-    print(f"  Stream processors: {stream_processor_success_count}/{total_count} created successfully")
+        summary.append(f"  Kafka connection: 0/1 created successfully")
+    summary.append(f"  Stream processors: {stream_processor_success_count}/{total_count} created successfully")
+    
+    print("\n".join(summary))
 
 
 def main():
@@ -255,6 +351,10 @@ def main():
     
     args = parser.parse_args()
     
+    # Show asp_utils progress messages on stdout alongside this script's output
+    logging.basicConfig(format='%(message)s', level=logging.INFO, stream=sys.stdout)
+    logging.getLogger('asp_utils.api_client').addFilter(_divert_worker_logs)
+    
     # Load and validate main config
     print("Loading main configuration...")
     main_config = load_json_file(args.main_config)
@@ -25,59 +25,173 @@ Connector config format:
 }
 """
 
-import json
-import os
+import logging
 import sys
-import requests
 import argparse
-import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
 
 # Add parent directory to path to import asp_utils
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
 # Import shared functions
 from asp_utils import (
     load_json_file, 
+    load_json_files,
+    list_json_files,
     create_kafka_connection, 
     check_atlas_auth_with_login, 
     create_mongodb_connection, 
     validate_main_config, 
-    create_stream_processor,
+    sp_create_stream_processor,
     create_topic,
-    create_simple_mongodb_to_kafka_topic_pipeline
+    build_mongodb_to_kafka_topic_pipeline_json
 )
 
+# Connectors processed at once; each one is a few network round trips
+_MAX_WORKERS = 16
 
+# Fields every source connector config must define
+_REQUIRED_CONNECTOR_FIELDS = frozenset({
+    "kafka.api.key",
+    "kafka.api.secret",
+    "topic.prefix",
+    "database",
+    "collection",
+    "connection.user",
+    "connection.password"
+})
 
 
 
 
+# asp_utils messages logged by worker threads, by thread id, while the thread collects them
+_worker_messages: Dict[int, List[str]] = {}
+
+
+def _divert_worker_logs(record: logging.LogRecord) -> bool:
+    """Logging filter that moves asp_utils messages from collecting worker threads out of the output."""
+    messages = _worker_messages.get(record.thread)
+    if messages is None:
+        return True
+    messages.append(record.getMessage())
+    return False
+
+
+def _collecting_logs(func, *args, **kwargs):
+    """
+    Call func on this worker thread, returning (result, messages it logged).
+    
+    The messages are printed later with the rest of the connector's results
+    rather than straight away, so the output of different connectors does
+    not interleave.
+    """
+    thread_id = threading.get_ident()
+    messages = _worker_messages[thread_id] = []
+    try:
+        return func(*args, **kwargs), messages
+    finally:
+        del _worker_messages[thread_id]
+
+
 def validate_connector_config(config: Dict[str, Any], filename: str) -> bool:
-    """Validate a connector configuration file."""
-    required_fields = ["kafka.api.key", "kafka.api.secret", "topic.prefix", "database", "collection", "connection.user", "connection.password"]
+    """Validate a connector configuration file, reporting every missing field."""
+    missing_fields = _REQUIRED_CONNECTOR_FIELDS.difference(config)
     
-    for field in required_fields:
-        if field not in config:
-            print(f"Error: Missing required field '{field}' in {filename}")
-            return False
+    for field in sorted(missing_fields):
+        print(f"Error: Missing required field '{field}' in {filename}")
     
-    return True
+    return not missing_fields
+
+
 
 
 
 
+def topic_name_for(connector_config: Dict[str, Any]) -> str:
+    """Return the Kafka topic a source connector config writes to."""
+    return f"{connector_config['topic.prefix']}.{connector_config['database']}.{connector_config['collection']}"
+
+
+def process_connector(
+    main_config: Dict[str, Any],
+    connector_config: Dict[str, Any],
+    topic_created: bool,
+    kafka_connection_created: bool,
+    mongodb_connection_created: bool
+) -> Tuple[bool, bool, bool, List[str]]:
+    """
+    Create the source stream processor for one connector config whose topic was created.
+    
+    Runs on a worker thread, so status lines are returned rather than printed
+    to keep the output of different connectors from interleaving.
+    
+    Returns:
+        tuple: (topic_created, kafka_connection_used, stream_processor_created, messages)
+    """
+    messages = []
+    
+    # Settings from the main config
+    kafka_conn_name = main_config["kafka-connection-name"]
+    sp_prefix = main_config["stream-processor-prefix"]
+    mongo_conn_name = main_config["mongodb-connection-name"]
+    sp_url = main_config["mongodb-stream-processor-instance-url"]
+    
+    # Extract required fields
+    database = connector_config["database"]
+    collection = connector_config["collection"]
+    connection_user = connector_config["connection.user"]
+    connection_password = connector_config["connection.password"]
+    topic_name = topic_name_for(connector_config)
+    
+    if not topic_created:
+        return False, False, False, messages
+    
+    # Since Kafka connection is already created, we just report success
+    if not kafka_connection_created:
+        messages.append(f"⚠ Skipping stream connection creation: Kafka connection not available")
+        return True, False, False, messages
+    
+    messages.append(f"✓ Using existing Kafka connection: {kafka_conn_name}")
+    
+    # Create stream processor if both connections exist
+    if not mongodb_connection_created:
+        messages.append(f"⚠ Skipping stream processor creation: MongoDB source connection not available")
+        return True, True, False, messages
+    
+    # Construct stream processor name
+    stream_processor_name = f"{sp_prefix}_{database}_{collection}"
+    
+    # Create source pipeline (MongoDB -> Kafka)
+    pipeline = build_mongodb_to_kafka_topic_pipeline_json(
+        mongo_conn_name,
+        database,
+        collection,
+        kafka_conn_name,
+        topic_name
+    )
+    
+    stream_processor_success, sp_messages = _collecting_logs(
+        sp_create_stream_processor,
+        connection_user,
+        connection_password,
+        sp_url,
+        stream_processor_name,
+        pipeline,
+        echo=False
+    )
+    messages.extend(sp_messages)
+    
+    return True, True, stream_processor_success, messages
 
 
 def process_connector_configs(main_config: Dict[str, Any], configs_folder: str) -> None:
     """Process all connector configuration files in the specified folder."""
     
-    # Check Atlas CLI authentication first - stop all processing if not authenticated
-    if not check_atlas_auth_with_login():
-        print("✗ All processing stopped due to authentication failure")
-        return
-    
     folder_path = Path(configs_folder)
     
     if not folder_path.exists():
@@ -88,8 +202,18 @@ def process_connector_configs(main_config: Dict[str, Any], configs_folder: str)
         print(f"Error: Path is not a directory: {configs_folder}")
         return
     
-    # Find all .json files in the folder
-    json_files = list(folder_path.glob("*.json"))
+    # Check Atlas CLI authentication in the background while the configs are read
+    with ThreadPoolExecutor(max_workers=1) as auth_executor:
+        auth_future = auth_executor.submit(check_atlas_auth_with_login)
+        
+        # Find all .json files in the folder and read them up front, in parallel
+        json_files = list_json_files(folder_path)
+        connector_configs = load_json_files(json_files)
+    
+    # Stop all processing if not authenticated
+    if not auth_future.result():
+        print("✗ All processing stopped due to authentication failure")
+        return
     
     if not json_files:
         print(f"No .json files found in {configs_folder}")
@@ -98,37 +222,49 @@ def process_connector_configs(main_config: Dict[str, Any], configs_folder: str)
     print(f"Found {len(json_files)} .json files to process")
     print("-" * 50)
     
+    # Settings used throughout, read once
+    mongo_conn_name = main_config["mongodb-connection-name"]
+    group_id = main_config["mongodb-group-id"]
+    tenant_name = main_config["mongodb-tenant-name"]
+    cluster_name = main_config["mongodb-cluster-name"]
+    kafka_conn_name = main_config["kafka-connection-name"]
+    rest_endpoint = main_config["confluent-rest-endpoint"]
+    cluster_id = main_config["confluent-cluster-id"]
+    
     # Create connections once (using first connector config for Kafka auth)
     kafka_connection_created = False
     kafka_connection_was_created = False
     mongodb_connection_created = False
     mongodb_connection_was_created = False
-    first_connector_config = None
     
-    for json_file in json_files:
-        connector_config = load_json_file(str(json_file))
+    # Validate every config once; the first valid one supplies the Kafka credentials
+    valid_connectors = []
+    for json_file, connector_config in zip(json_files, connector_configs):
+        print(f"\nProcessing: {json_file.name}")
+        
         if connector_config and validate_connector_config(connector_config, json_file.name):
-            first_connector_config = connector_config
-            break
+            valid_connectors.append((json_file, connector_config))
+    
+    first_connector_config = valid_connectors[0][1] if valid_connectors else None
     
     # Create MongoDB source connection
-    print(f"\nCreating shared MongoDB source connection: {main_config['mongodb-connection-name']}")
+    print(f"\nCreating shared MongoDB source connection: {mongo_conn_name}")
     mongodb_connection_created, mongodb_connection_was_created = create_mongodb_connection(
-        main_config["mongodb-group-id"],
-        main_config["mongodb-tenant-name"],
-        main_config["mongodb-cluster-name"],
-        main_config["mongodb-connection-name"],
+        group_id,
+        tenant_name,
+        cluster_name,
+        mongo_conn_name,
         role_name="readAnyDatabase"  # Source connections need read access
     )
     
     # Create Kafka connection
     if first_connector_config:
-        print(f"\nCreating shared Kafka connection: {main_config['kafka-connection-name']}")
+        print(f"\nCreating shared Kafka connection: {kafka_conn_name}")
         kafka_connection_created, kafka_connection_was_created = create_kafka_connection(
-            main_config["mongodb-group-id"],
-            main_config["mongodb-tenant-name"],
-            main_config["kafka-connection-name"],
-            main_config["confluent-rest-endpoint"],
+            group_id,
+            tenant_name,
+            kafka_conn_name,
+            rest_endpoint,
             first_connector_config["kafka.api.key"],
             first_connector_config["kafka.api.secret"]
         )
@@ -138,91 +274,65 @@ def process_connector_configs(main_config: Dict[str, Any], configs_folder: str)
     stream_processor_success_count = 0
     total_count = len(json_files)
     
-    for json_file in json_files:
-        print(f"\nProcessing: {json_file.name}")
-        
-        # Load connector config
-        connector_config = load_json_file(str(json_file))
-        if not connector_config:
-            continue
+    # Two stages: each connector's stream processor is submitted as soon as its
+    # topic exists, so processor creation overlaps the remaining topic requests
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as topic_pool, \
+            ThreadPoolExecutor(max_workers=_MAX_WORKERS) as stream_processor_pool:
+        topic_futures = {
+            topic_pool.submit(
+                _collecting_logs,
+                create_topic,
+                rest_endpoint,
+                cluster_id,
+                connector_config["kafka.api.key"],
+                connector_config["kafka.api.secret"],
+                topic_name_for(connector_config)
+            ): (json_file, connector_config)
+            for json_file, connector_config in valid_connectors
+        }
         
-        # Validate connector config
-        if not validate_connector_config(connector_config, json_file.name):
-            continue
+        futures = {}
+        for topic_future in as_completed(topic_futures):
+            json_file, connector_config = topic_futures[topic_future]
+            topic_created, topic_messages = topic_future.result()
+            futures[stream_processor_pool.submit(
+                process_connector,
+                main_config,
+                connector_config,
+                topic_created,
+                kafka_connection_created,
+                mongodb_connection_created
+            )] = (json_file, topic_messages)
         
-        # Extract required fields
-        api_key = connector_config["kafka.api.key"]
-        api_secret = connector_config["kafka.api.secret"]
-        topic_prefix = connector_config["topic.prefix"]
-        database = connector_config["database"]
-        collection = connector_config["collection"]
-        connection_user = connector_config["connection.user"]
-        connection_password = connector_config["connection.password"]
-        
-        # Construct topic name
-        topic_name = f"{topic_prefix}.{database}.{collection}"
-        
-        # Create Kafka topic
-        kafka_success = create_topic(
-            main_config["confluent-rest-endpoint"],
-            main_config["confluent-cluster-id"],
-            api_key,
-            api_secret,
-            topic_name
-        )
-        
-        if kafka_success:
-            kafka_success_count += 1
+        for future in as_completed(futures):
+            kafka_success, stream_success, stream_processor_success, messages = future.result()
+            json_file, topic_messages = futures[future]
+            messages = topic_messages + messages
+            
+            # One write per connector rather than one per line
+            if messages:
+                print("\n".join([f"\nResults for {json_file.name}:", *messages]))
             
-            # Since Kafka connection is already created, we just report success
-            if kafka_connection_created:
-                stream_success_count += 1
-                print(f"✓ Using existing Kafka connection: {main_config['kafka-connection-name']}")
-                
-                # Create stream processor if both connections exist
-                if mongodb_connection_created:
-                    # Construct stream processor name and topic name
-                    stream_processor_name = f"{main_config['stream-processor-prefix']}_{database}_{collection}"
-                    topic_name = f"{topic_prefix}.{database}.{collection}"
-                    
-                    # Create source pipeline (MongoDB -> Kafka)
-                    pipeline = create_simple_mongodb_to_kafka_topic_pipeline(
-                        main_config["mongodb-connection-name"],
-                        database,
-                        collection,
-                        main_config["kafka-connection-name"],
-                        topic_name
-                    )
-                    
-                    stream_processor_success = create_stream_processor(
-                        connection_user,
-                        connection_password,
-                        main_config["mongodb-stream-processor-instance-url"],
-                        stream_processor_name,
-                        pipeline
-                    )
-                    
-                    if stream_processor_success:
-                        stream_processor_success_count += 1
-                else:
-                    print(f"⚠ Skipping stream processor creation: MongoDB source connection not available")
-            else:
-                print(f"⚠ Skipping stream connection creation: Kafka connection not available")
+            kafka_success_count += kafka_success
+            stream_success_count += stream_success
+            stream_processor_success_count += stream_processor_success
     
-    print("-" * 50)
-    print(f"Summary:")
-    print(f"  Kafka topics: {kafka_success_count}/{total_count} created successfully")
+    # Built up and written in one go
+    summary = ["-" * 50, "Summary:"]
+    summary.append(f"  Kafka topics: {kafka_success_count}/{total_count} created successfully")
     if mongodb_connection_created:
         connection_status = "created" if mongodb_connection_was_created else "reused (already existed)"
-        print(f"  MongoDB source connection: 1/1 {connection_status}")
+        summary.append(f"  MongoDB source connection: 1/1 {connection_status}")
     else:
-        print(f"  MongoDB source connection: 0/1 created successfully")
+        summary.append(f"  MongoDB source connection: 0/1 created successfully")
     if kafka_connection_created:
         connection_status = "created" if kafka_connection_was_created else "reused (already existed)"
-        print(f"  Kafka connection: 1/1 {connection_status}")
+        summary.append(f"  Kafka connection: 1/1 {connection_status}")
     else:
-        print(f"  Kafka connection: 0/1 created successfully")
-    print(f"  Stream processors: {stream_processor_success_count}/{total_count} created successfully")
+        summary.append(f"  Kafka connection: 0/1 created successfully")
+    summary.append(f"  Stream processors: {stream_processor_success_count}/{total_count} created successfully")
+    
+    print("\n".join(summary))
 
 
 def main():
@@ -246,6 +356,10 @@ def main():
     
     args = parser.parse_args()
     
+    # Show asp_utils progress messages on stdout alongside this script's output
+    logging.basicConfig(format='%(message)s', level=logging.INFO, stream=sys.stdout)
+    logging.getLogger('asp_utils.api_client').addFilter(_divert_worker_logs)
+    
     # Load and validate main config
     print("Loading main configuration...")
     main_config = load_json_file(args.main_config)
@@ -9,6 +9,7 @@ Usage:
     python3 run_tests.py --unit-only          # Run only unit tests (fast, no auth required)  
     python3 run_tests.py --integration-only   # Run only integration tests (requires Atlas CLI auth)
     python3 run_tests.py -v                   # Run all tests with verbose output
+    python3 run_tests.py --no-parallel        # Run unit tests serially even if pytest-xdist is installed
     python3 run_tests.py tests.test_common    # Run specific test module
 
 Test Types:
@@ -16,6 +17,7 @@ Test Types:
     - Integration tests: Full end-to-end tests that require Atlas CLI authentication
 """
 
+import importlib.util
 import unittest
 import sys
 import os
@@ -25,22 +27,60 @@ import json
 from pathlib import Path
 
 
+def _discover(test_dir, pattern, top_level_dir):
+    """Discover the tests under test_dir."""
+    return unittest.TestLoader().discover(
+        start_dir=str(test_dir),
+        pattern=pattern,
+        top_level_dir=str(top_level_dir)
+    )
+
+
+def _run_parallel(test_dir, pattern, verbosity):
+    """
+    Run the tests under test_dir on all cores with pytest-xdist.
+    
+    Returns:
+        bool: True if all tests passed, False otherwise, or None if pytest-xdist is not installed
+    """
+    if importlib.util.find_spec("pytest") is None or importlib.util.find_spec("xdist") is None:
+        return None
+    
+    command = [
+        sys.executable, '-m', 'pytest', str(test_dir),
+        '-n', 'auto',
+        '-o', f'python_files={pattern}',
+        '-v' if verbosity > 1 else '-q'
+    ]
+    return subprocess.run(command).returncode == 0
+
+
+def _outcome(success, tests_run, failures, return_counts):
+    """Return success alone, or with the test counts when return_counts is set."""
+    return (success, tests_run, failures) if return_counts else success
+
+
 def check_atlas_auth():
     """Check if user is authenticated with Atlas CLI."""
     try:
         result = subprocess.run(['atlas', 'auth', 'whoami'], 
-                              capture_output=True, text=True, timeout=10)
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
         return result.returncode == 0
     except Exception:
         return False
 
 
-def run_unit_tests(verbosity=1, pattern="test*.py", start_dir="tests/unit"):
+def run_unit_tests(verbosity=1, pattern="test*.py", start_dir="tests/unit", parallel=False, return_counts=False):
     """
     Run unit tests (fast, mocked, no external dependencies).
     
+    With parallel set, tests are spread over all cores using pytest-xdist
+    when it is installed, falling back to the serial runner otherwise.
+    
     Returns:
-        bool: True if all tests passed, False otherwise
+        bool: True if all tests passed, False otherwise. With return_counts set,
+            a (success, tests run, failures + errors) tuple instead; a failed
+            parallel run counts as one failure.
     """
     print("🧪 Running Unit Tests (fast, no auth required)")
     print("=" * 50)
@@ -51,26 +91,29 @@ def run_unit_tests(verbosity=1, pattern="test*.py", start_dir="tests/unit"):
     
     if not test_dir.exists():
         print(f"Error: Test directory '{test_dir}' does not exist")
-        return False
+        return _outcome(False, 0, 1, return_counts)
     
     # Discover tests
-    loader = unittest.TestLoader()
-    suite = loader.discover(
-        start_dir=str(test_dir),
-        pattern=pattern,
-        top_level_dir=str(script_dir)
-    )
+    suite = _discover(test_dir, pattern, script_dir)
     
     # Count tests
     test_count = suite.countTestCases()
     if test_count == 0:
         print(f"No unit tests found in '{test_dir}' matching pattern '{pattern}'")
         print("✅ Unit tests: SKIPPED (no tests found)")
-        return True  # Changed to True since no tests is not a failure
+        return _outcome(True, 0, 0, return_counts)  # Changed to True since no tests is not a failure
     
     print(f"Discovered {test_count} unit test(s)")
     print("-" * 50)
     
+    if parallel:
+        parallel_success = _run_parallel(test_dir, pattern, verbosity)
+        if parallel_success is not None:
+            print("-" * 50)
+            print("✅ All unit tests passed!" if parallel_success else "❌ Some unit tests failed")
+            return _outcome(parallel_success, test_count, 0 if parallel_success else 1, return_counts)
+        print("pytest-xdist not installed, running unit tests serially")
+    
     # Run tests
     runner = unittest.TextTestRunner(verbosity=verbosity, buffer=True)
     result = runner.run(suite)
@@ -90,19 +133,19 @@ def run_unit_tests(verbosity=1, pattern="test*.py", start_dir="tests/unit"):
     
     if failures == 0 and errors == 0:
         print("✅ All unit tests passed!")
-        return True
     else:
         print("❌ Some unit tests failed")
-        return False
+    return _outcome(failures == 0 and errors == 0, tests_run, failures + errors, return_counts)
 
 
 
-def run_integration_tests(verbosity=1, pattern="test*.py", start_dir="tests/integration"):
+def run_integration_tests(verbosity=1, pattern="test*.py", start_dir="tests/integration", return_counts=False):
     """
     Run integration tests (requires Atlas CLI authentication).
     
     Returns:
-        bool: True if all tests passed, False otherwise
+        bool: True if all tests passed, False otherwise. With return_counts set,
+            a (success, tests run, failures + errors) tuple instead.
     """
     print("🚀 Running Integration Tests (requires Atlas CLI auth)")
     print("=" * 60)
@@ -113,7 +156,7 @@ def run_integration_tests(verbosity=1, pattern="test*.py", start_dir="tests/inte
         print("You must be authenticated with Atlas CLI to run integration tests.")
         print("Please run: atlas auth login")
         print("\nAlternatively, run unit tests only: python3 run_tests.py --unit-only")
-        return False
+        return _outcome(False, 0, 1, return_counts)
     
     print("✅ Atlas CLI authentication verified")
     
@@ -123,21 +166,16 @@ def run_integration_tests(verbosity=1, pattern="test*.py", start_dir="tests/inte
     
     if not test_dir.exists():
         print(f"Error: Integration test directory '{test_dir}' does not exist")
-        return False
+        return _outcome(False, 0, 1, return_counts)
     
     # Discover integration tests
-    loader = unittest.TestLoader()
-    suite = loader.discover(
-        start_dir=str(test_dir),
-        pattern=pattern,
-        top_level_dir=str(script_dir)
-    )
+    suite = _discover(test_dir, pattern, script_dir)
     
     # Count tests
     test_count = suite.countTestCases()
     if test_count == 0:
         print(f"No integration tests found in '{test_dir}' matching pattern '{pattern}'")
-        return False
+        return _outcome(False, 0, 1, return_counts)
     
     print(f"Discovered {test_count} integration test(s)")
     print("-" * 60)
@@ -161,10 +199,9 @@ def run_integration_tests(verbosity=1, pattern="test*.py", start_dir="tests/inte
     
     if failures == 0 and errors == 0:
         print("✅ All integration tests passed!")
-        return True
     else:
         print("❌ Some integration tests failed")
-        return False
+    return _outcome(failures == 0 and errors == 0, tests_run, failures + errors, return_counts)
 
 
 def main():
@@ -195,6 +232,13 @@ def main():
         help="Run only integration tests (requires Atlas CLI auth)"
     )
     
+    parser.add_argument(
+        "--parallel",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Run unit tests on all cores with pytest-xdist (default: on with more than 2 CPUs)"
+    )
+    
     parser.add_argument(
         "-p", "--pattern",
         default="test*.py",
@@ -204,6 +248,7 @@ def main():
     args = parser.parse_args()
     
     verbosity = 2 if args.verbose else 1
+    parallel = args.parallel if args.parallel is not None else (os.cpu_count() or 1) > 2
     
     # Handle test type flags
     unit_success = True
@@ -211,7 +256,7 @@ def main():
     
     if args.unit_only:
         # Run only unit tests
-        unit_success = run_unit_tests(verbosity=verbosity, pattern=args.pattern)
+        unit_success = run_unit_tests(verbosity=verbosity, pattern=args.pattern, parallel=parallel)
         success = unit_success
         
     elif args.integration_only:
@@ -221,7 +266,7 @@ def main():
         
     else:
         # Run both unit and integration tests
-        unit_success = run_unit_tests(verbosity=verbosity, pattern=args.pattern)
+        unit_success = run_unit_tests(verbosity=verbosity, pattern=args.pattern, parallel=parallel)
         
         if unit_success:
             print("\n" + "="*60)
@@ -1 +1,9 @@
-# This file makes the tests directory a Python package
\ No newline at end of file
+# This file makes the tests directory a Python package
+
+import sys
+from pathlib import Path
+
+# The tests import the shared asp_utils package from the repository root
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
@@ -10,11 +10,8 @@ import subprocess
 import tempfile
 import json
 import os
-import shutil
-
-# Add parent directory to path to import from asp_utils
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 from asp_utils import check_atlas_auth_with_login
 
@@ -22,14 +19,13 @@ from asp_utils import check_atlas_auth_with_login
 class TestSinkProcessorScript(unittest.TestCase):
     """Integration tests for the sink processor script."""
     
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        # Check authentication before running any tests
-        if not check_atlas_auth_with_login():
-            self.skipTest("Atlas CLI authentication required for integration tests")
+    @classmethod
+    def setUpClass(cls):
+        """Check Atlas CLI authentication and write the config fixtures once for the whole class."""
+        cls.authenticated = check_atlas_auth_with_login()
         
         # Create temporary test config
-        self.test_config = {
+        cls.test_config = {
             "confluent-cluster-id": "test-cluster-id",
             "confluent-rest-endpoint": "https://test-endpoint.com:443",
             "mongodb-stream-processor-instance-url": "mongodb://test-url/",
@@ -41,13 +37,18 @@ class TestSinkProcessorScript(unittest.TestCase):
             "mongodb-tenant-name": "test-tenant"
         }
         
+        # All fixtures live in one temporary directory, removed in a single cleanup
+        cls.fixture_dir = tempfile.TemporaryDirectory()
+        fixture_root = Path(cls.fixture_dir.name)
+        
         # Create temporary config file
-        self.temp_config = tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False)
-        json.dump(self.test_config, self.temp_config, indent=2)
-        self.temp_config.close()
+        cls.main_config_path = str(fixture_root / "main_config.json")
+        with open(cls.main_config_path, 'w') as f:
+            json.dump(cls.test_config, f, indent=2)
         
         # Create temporary connector configs directory
-        self.temp_dir = tempfile.mkdtemp()
+        cls.temp_dir = str(fixture_root / "connectors")
+        os.mkdir(cls.temp_dir)
         
         # Create test sink connector config
         connector_config = {
@@ -61,79 +62,81 @@ class TestSinkProcessorScript(unittest.TestCase):
             "collection": "testcoll"
         }
         
-        config_file = os.path.join(self.temp_dir, "test_sink_config.json")
+        config_file = os.path.join(cls.temp_dir, "test_sink_config.json")
         with open(config_file, 'w') as f:
             json.dump(connector_config, f, indent=2)
+        
+        # Empty connector configs directory
+        cls.empty_dir = str(fixture_root / "empty")
+        os.mkdir(cls.empty_dir)
+        
+        # Most tests only inspect the output of the same run, so run the script once
+        # per input folder, both runs at the same time
+        cls.result = cls.empty_dir_result = None
+        if cls.authenticated:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                result = executor.submit(cls._run_script, cls.temp_dir)
+                empty_dir_result = executor.submit(cls._run_script, cls.empty_dir)
+            cls.result = result.result()
+            cls.empty_dir_result = empty_dir_result.result()
     
-    def tearDown(self):
-        """Clean up test fixtures after each test method."""
-        # Clean up temporary files
+    @classmethod
+    def _run_script(cls, configs_folder):
+        """Run the script on a connector configs folder; returns None if it times out."""
+        cmd = ['python3', 'create_sink_processors.py', cls.main_config_path, configs_folder]
         try:
-            os.unlink(self.temp_config.name)
-            shutil.rmtree(self.temp_dir)
-        except:
-            pass  # Best effort cleanup
+            return subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        except subprocess.TimeoutExpired:
+            return None
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the config fixtures after the last test."""
+        cls.fixture_dir.cleanup()
+    
+    def setUp(self):
+        """Skip every test if authentication failed."""
+        if not self.authenticated:
+            self.skipTest("Atlas CLI authentication required for integration tests")
     
     def test_script_loads_config_successfully(self):
         """Test that the script can load and validate the config."""
-        cmd = ['python3', 'create_sink_processors.py', self.temp_config.name, self.temp_dir]
-        
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            
-            # Script should load config successfully (even if it fails later due to auth/network)
-            self.assertIn("Loading main configuration", result.stdout)
-            self.assertIn("Main config loaded successfully", result.stdout)
-            
-        except subprocess.TimeoutExpired:
+        if self.result is None:
             self.fail("Script timed out - may indicate hanging")
+        
+        # Script should load config successfully (even if it fails later due to auth/network)
+        self.assertIn("Loading main configuration", self.result.stdout)
+        self.assertIn("Main config loaded successfully", self.result.stdout)
     
     def test_script_validates_config_fields(self):
         """Test that the script validates all required config fields."""
-        cmd = ['python3', 'create_sink_processors.py', self.temp_config.name, self.temp_dir]
-        
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            
-            # Should not fail validation (may fail later for other reasons)
-            self.assertNotIn("Error: Missing required field", result.stdout)
-            self.assertNotIn("Error: Missing required field", result.stderr)
-            
-        except subprocess.TimeoutExpired:
+        if self.result is None:
             self.fail("Script timed out during config validation")
+        
+        # Should not fail validation (may fail later for other reasons)
+        self.assertNotIn("Error: Missing required field", self.result.stdout)
+        self.assertNotIn("Error: Missing required field", self.result.stderr)
     
     def test_script_handles_missing_connector_configs(self):
         """Test that the script handles missing connector config files gracefully."""
-        # Create empty directory
-        empty_dir = tempfile.mkdtemp()
+        if self.empty_dir_result is None:
+            self.fail("Script timed out on an empty connector configs folder")
         
-        try:
-            cmd = ['python3', 'create_sink_processors.py', self.temp_config.name, empty_dir]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            
-            # Should handle missing configs gracefully
-            self.assertTrue(
-                "No .json files found" in result.stdout or
-                result.returncode == 0  # Script completes successfully
-            )
-            
-        finally:
-            shutil.rmtree(empty_dir)
+        # Should handle missing configs gracefully
+        self.assertTrue(
+            "No .json files found" in self.empty_dir_result.stdout or
+            self.empty_dir_result.returncode == 0  # Script completes successfully
+        )
     
     def test_script_displays_config_summary(self):
         """Test that the script displays the loaded configuration summary."""
-        cmd = ['python3', 'create_sink_processors.py', self.temp_config.name, self.temp_dir]
-        
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            
-            # Should display config summary
-            self.assertIn("Confluent Cluster ID:", result.stdout)
-            self.assertIn("Stream Processor URL:", result.stdout)
-            self.assertIn("Kafka Connection Name:", result.stdout)
-            
-        except subprocess.TimeoutExpired:
+        if self.result is None:
             self.fail("Script timed out before displaying config summary")
+        
+        # Should display config summary
+        self.assertIn("Confluent Cluster ID:", self.result.stdout)
+        self.assertIn("Stream Processor URL:", self.result.stdout)
+        self.assertIn("Kafka Connection Name:", self.result.stdout)
     
     def test_script_handles_topic_array_format(self):
         """Test that the script handles topics as both string and array."""
@@ -152,8 +155,10 @@ class TestSinkProcessorScript(unittest.TestCase):
         config_file = os.path.join(self.temp_dir, "test_array_topics.json")
         with open(config_file, 'w') as f:
             json.dump(connector_config, f, indent=2)
+        # The connector configs folder is shared by the class, so don't leave this behind
+        self.addCleanup(os.unlink, config_file)
         
-        cmd = ['python3', 'create_sink_processors.py', self.temp_config.name, self.temp_dir]
+        cmd = ['python3', 'create_sink_processors.py', self.main_config_path, self.temp_dir]
         
         try:
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
@@ -5,9 +5,10 @@ Top-level test runner for all ASP Tools projects.
 This script orchestrates testing across all subprojects in the asp_tools repository.
 """
 
-import subprocess
-import sys
+import importlib.util
 import os
+import sys
+import unittest
 from pathlib import Path
 
 
@@ -17,60 +18,41 @@ def run_asp_utils_tests():
     print("=" * 50)
     
     # Discover and run asp_utils tests
-    test_dir = Path(__file__).parent / "asp_utils" / "tests"
+    root_dir = Path(__file__).parent
+    test_dir = root_dir / "asp_utils" / "tests"
     
     if not test_dir.exists():
         print("No asp_utils tests found")
         return True, 0, 0
     
     try:
-        result = subprocess.run([
-            sys.executable, '-m', 'unittest', 'discover',
-            '-s', str(test_dir),
-            '-p', 'test_*.py',
-            '-v'
-        ], capture_output=True, text=True, timeout=120)
-        
-        print(result.stdout)
-        if result.stderr:
-            print(result.stderr)
-        
-        # Count tests from output - look for the final summary line
-        lines = result.stdout.split('\n')
-        test_count = 0
-        
-        # Look for "Ran X tests in Y.Ys" pattern
-        for line in lines:
-            line = line.strip()
-            if line.startswith('Ran ') and ' tests in ' in line:
-                try:
-                    # Extract number between "Ran " and " tests"
-                    # Example: "Ran 22 tests in 0.010s"
-                    parts = line.split(' ')
-                    if len(parts) >= 3 and parts[0] == 'Ran' and parts[2] == 'tests':
-                        test_count = int(parts[1])
-                        break
-                except (IndexError, ValueError):
-                    pass
-        
-        # If that fails, count individual test method lines as backup
-        if test_count == 0:
-            test_count = sum(1 for line in lines if line.strip().startswith('test_') and '...' in line)
+        # Run in this interpreter and read the counts straight off the result
+        suite = unittest.TestLoader().discover(
+            start_dir=str(test_dir),
+            pattern='test_*.py',
+            top_level_dir=str(root_dir)
+        )
+        result = unittest.TextTestRunner(verbosity=2, stream=sys.stdout).run(suite)
         
-        success = result.returncode == 0
+        success = result.wasSuccessful()
         print(f"ASP Utils Tests: {'✅ PASSED' if success else '❌ FAILED'}")
         print("-" * 50)
         
-        return success, test_count, 0 if success else 1
+        return success, result.testsRun, len(result.failures) + len(result.errors)
         
-    except subprocess.TimeoutExpired:
-        print("❌ ASP Utils tests timed out")
-        return False, 0, 1
     except Exception as e:
         print(f"❌ Error running ASP Utils tests: {e}")
         return False, 0, 1
 
 
+def _load_module(name, path):
+    """Import a standalone script as a module."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 def run_confluent_config_to_asp_tests():
     """Run tests for confluent_config_to_asp project."""
     print("🧪 Running Confluent Config to ASP Tests")
@@ -83,62 +65,35 @@ def run_confluent_config_to_asp_tests():
         print("No confluent_config_to_asp run_tests.py found")
         return True, 0, 0
     
+    # The project's tests run its scripts by relative path, so run them from the project directory
+    original_cwd = os.getcwd()
     try:
-        result = subprocess.run([
-            sys.executable, str(run_tests_script)
-        ], cwd=str(project_dir), capture_output=True, text=True, timeout=300)
+        os.chdir(project_dir)
         
-        print(result.stdout)
-        if result.stderr:
-            print(result.stderr)
+        # Use the project's own runner functions in this interpreter
+        project_runner = _load_module("confluent_config_to_asp_run_tests", run_tests_script)
         
-        success = result.returncode == 0
+        success, tests_run, failures = project_runner.run_unit_tests(return_counts=True)
+        if success:
+            print("\n" + "=" * 60)
+            success, integration_tests_run, integration_failures = project_runner.run_integration_tests(
+                return_counts=True
+            )
+            tests_run += integration_tests_run
+            failures += integration_failures
+        else:
+            print("\n⚠️  Skipping integration tests due to unit test failures")
         
-        # Parse test counts from output
-        lines = result.stdout.split('\n')
-        unit_tests = 0
-        integration_tests = 0
-        failed_tests = 0
-        
-        for line in lines:
-            # Look for "Tests run: X" in summaries
-            if "Tests run:" in line and "unit" in line.lower():
-                try:
-                    unit_tests = int(line.split("Tests run:")[1].split(',')[0].strip())
-                except:
-                    pass
-            elif "Tests run:" in line and "integration" in line.lower():
-                try:
-                    integration_tests = int(line.split("Tests run:")[1].split(',')[0].strip())
-                except:
-                    pass
-            # Also look for "Ran X tests in Y.Ys" pattern for unittest output
-            elif line.strip().startswith('Ran ') and ' tests in ' in line:
-                try:
-                    parts = line.strip().split(' ')
-                    if len(parts) >= 3 and parts[0] == 'Ran' and parts[2] == 'tests':
-                        test_count = int(parts[1])
-                        # If we haven't found specific counts, use this as total
-                        if unit_tests == 0 and integration_tests == 0:
-                            integration_tests = test_count  # Assume integration for now
-                except:
-                    pass
-            elif "Failures:" in line or "Errors:" in line:
-                if not success:
-                    failed_tests = max(failed_tests, 1)
-        
-        total_tests = unit_tests + integration_tests
         print(f"Confluent Config to ASP Tests: {'✅ PASSED' if success else '❌ FAILED'}")
         print("-" * 50)
         
-        return success, total_tests, failed_tests
+        return success, tests_run, failures
         
-    except subprocess.TimeoutExpired:
-        print("❌ Confluent Config to ASP tests timed out")
-        return False, 0, 1
     except Exception as e:
         print(f"❌ Error running Confluent Config to ASP tests: {e}")
         return False, 0, 1
+    finally:
+        os.chdir(original_cwd)
 
 
 def run_text_to_processor_tests():
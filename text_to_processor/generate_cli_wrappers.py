@@ -2,130 +2,130 @@
 """
 CLI Wrapper Generator for ASP Utils
 
-This script automatically generates CLI wrapper scripts for all functions
-exported from the asp_utils package. Each wrapper reads a JSON config file
-and calls the corresponding asp_utils function.
+This script generates a single CLI entry point for all functions exported
+from the asp_utils package. The entry point takes a function name and a JSON
+config file and calls the corresponding asp_utils function.
 
 Usage:
-    python generate_cli_wrappers.py
+    python generate_cli_wrappers.py [--watch]
 
 This will:
-1. Delete all existing files in temp/ directory
-2. Generate fresh CLI wrapper scripts for each asp_utils function
+1. Generate the CLI entry point (cli.py) and a usage.json listing each function's
+   config format, rewriting them only when they changed
+2. Remove per-function wrappers left over from earlier versions
 3. Place them in temp/ directory (untracked by git)
+
+With --watch it keeps running and regenerates the CLI whenever a module in
+asp_utils changes, reusing the already-imported package.
 """
 
+import argparse
+import importlib
 import os
 import sys
-import shutil
 import inspect
 import json
+import time
+import typing
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path to import asp_utils
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
 import asp_utils
 
+# Seconds between checks of the asp_utils sources in --watch mode
+_WATCH_INTERVAL = 1.0
 
-def clean_temp_directory():
-    """Remove and recreate the temp directory structure."""
-    temp_dir = Path("temp")
-    cli_wrappers_dir = temp_dir / "cli_wrappers"
-    sessions_dir = temp_dir / "sessions"
-    
-    # Remove existing cli_wrappers directory (always regenerated)
-    if cli_wrappers_dir.exists():
-        print(f"🗑️  Removing existing CLI wrappers directory...")
-        shutil.rmtree(cli_wrappers_dir)
-    
-    # Create temp directory structure
-    print(f"📁 Creating temp directory structure...")
-    temp_dir.mkdir(exist_ok=True)
-    cli_wrappers_dir.mkdir(exist_ok=True)
-    sessions_dir.mkdir(exist_ok=True)
-    
-    return cli_wrappers_dir
-
-
-def get_asp_utils_functions():
-    """Get all functions exported from asp_utils package."""
-    functions = {}
-    
-    # Get all attributes from asp_utils
-    for name in dir(asp_utils):
-        if not name.startswith('_'):  # Skip private attributes
-            attr = getattr(asp_utils, name)
-            if callable(attr) and hasattr(attr, '__module__'):
-                # Only include functions from asp_utils modules
-                if attr.__module__.startswith('asp_utils'):
-                    functions[name] = attr
-    
-    return functions
+# Example config values for required parameters, by annotated type (or its typing origin)
+_DEFAULT_EXAMPLE = "your_value_here"
+_TYPE_EXAMPLES = {
+    str: "your_value_here",
+    int: 123,
+    bool: True,
+    list: ["item1", "item2"],
+    dict: {"key": "value"}
+}
 
 
-def generate_cli_wrapper(func_name, func, temp_dir):
-    """Generate a CLI wrapper script for a single function."""
-    
-    # Get function signature
-    sig = inspect.signature(func)
-    params = list(sig.parameters.keys())
-    
-    # Create the CLI script content
-    script_content = f'''#!/usr/bin/env python3
+# Source of the CLI entry point; functions are looked up by name when it runs
+_DISPATCHER_SOURCE = '''#!/usr/bin/env python3
 """
-Auto-generated CLI wrapper for asp_utils.{func_name}
+Auto-generated CLI entry point for asp_utils
 
-This script reads a JSON config file and calls asp_utils.{func_name}
-with the parameters specified in the config.
+This script reads a JSON config file and calls the named asp_utils
+function with the parameters specified in the config.
 
 Usage:
-    python cli_{func_name}.py <config_file.json>
+    python cli.py <func_name> <config_file.json>
 
-Config file format:
-{{
-{_generate_config_example(sig)}
-}}
+The config file format of each function is listed in usage.json.
 """
 
+import asyncio
+import inspect
 import json
+import logging
 import sys
 import os
+from pathlib import Path
 
 # Add parent directory to path to import asp_utils
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+_REPO_ROOT = str(Path(__file__).resolve().parents[3])
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
-from asp_utils import {func_name}
+import asp_utils
 
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python cli_{func_name}.py <config_file.json>")
+    if len(sys.argv) != 3:
+        print("Usage: python cli.py <func_name> <config_file.json>")
         sys.exit(1)
     
-    config_file = sys.argv[1]
+    # Show asp_utils progress messages on stdout
+    logging.basicConfig(format='%(message)s', level=logging.INFO, stream=sys.stdout)
+    
+    func_name, config_file = sys.argv[1], sys.argv[2]
+    
+    if func_name not in asp_utils.__all__:
+        print(f"Error: Unknown asp_utils function: {func_name}")
+        print(f"Available functions: {', '.join(sorted(asp_utils.__all__))}")
+        sys.exit(1)
+    func = getattr(asp_utils, func_name)
     
     if not os.path.exists(config_file):
-        print(f"Error: Config file not found: {{config_file}}")
+        print(f"Error: Config file not found: {config_file}")
         sys.exit(1)
     
     try:
         with open(config_file, 'r') as f:
             config = json.load(f)
     except json.JSONDecodeError as e:
-        print(f"Error: Invalid JSON in config file: {{e}}")
+        print(f"Error: Invalid JSON in config file: {e}")
         sys.exit(1)
     except Exception as e:
-        print(f"Error: Could not read config file: {{e}}")
+        print(f"Error: Could not read config file: {e}")
         sys.exit(1)
     
     try:
         # Extract parameters from config
-{_generate_param_extraction(sig)}
+        kwargs = {}
+        for name, param in inspect.signature(func).parameters.items():
+            if param.default is inspect.Parameter.empty:
+                kwargs[name] = config[name]
+            else:
+                kwargs[name] = config.get(name, param.default)
         
-        # Call the function
+        # Call the function; coroutine functions are run to completion on a fresh event loop
         print(f"Calling {func_name} with provided parameters...")
-        result = {func_name}({', '.join(params)})
+        if inspect.iscoroutinefunction(func):
+            result = asyncio.run(func(**kwargs))
+        else:
+            result = func(**kwargs)
         
         # Output result
         if result is not None:
@@ -135,86 +135,170 @@ def main():
             elif isinstance(result, tuple):
                 print("Result (tuple):")
                 for i, item in enumerate(result):
-                    print(f"  [{{i}}]: {{item}}")
+                    print(f"  [{i}]: {item}")
             else:
-                print(f"Result: {{result}}")
+                print(f"Result: {result}")
         else:
             print("Function completed successfully (no return value)")
-            
+    
     except KeyError as e:
-        print(f"Error: Missing required parameter in config: {{e}}")
+        print(f"Error: Missing required parameter in config: {e}")
         sys.exit(1)
     except Exception as e:
-        print(f"Error calling {func_name}: {{e}}")
+        print(f"Error calling {func_name}: {e}")
         sys.exit(1)
 
 
 if __name__ == "__main__":
     main()
 '''
+
+
+def clean_temp_directory():
+    """Create the temp directory structure if needed; existing wrappers are updated in place."""
+    temp_dir = Path("temp")
+    cli_wrappers_dir = temp_dir / "cli_wrappers"
+    sessions_dir = temp_dir / "sessions"
     
-    # Write the CLI script
-    script_path = temp_dir / f"cli_{func_name}.py"
-    with open(script_path, 'w') as f:
-        f.write(script_content)
+    # Create temp directory structure
+    print(f"📁 Creating temp directory structure...")
+    temp_dir.mkdir(exist_ok=True)
+    cli_wrappers_dir.mkdir(exist_ok=True)
+    sessions_dir.mkdir(exist_ok=True)
+    
+    return cli_wrappers_dir
+
+
+def get_asp_utils_functions():
+    """Get all functions exported from asp_utils package."""
+    functions = {}
+    
+    # Exported names, falling back to every public attribute
+    module_dict = vars(asp_utils)
+    names = getattr(asp_utils, '__all__', None) or [name for name in module_dict if not name.startswith('_')]
     
-    # Make it executable
-    os.chmod(script_path, 0o755)
+    for name in names:
+        attr = module_dict.get(name)
+        # Only include functions from asp_utils modules
+        if callable(attr) and getattr(attr, '__module__', '').startswith('asp_utils'):
+            functions[name] = attr
     
-    return script_path
+    return functions
 
 
-def _generate_config_example(sig):
-    """Generate example config JSON for function signature."""
-    lines = []
-    for param_name, param in sig.parameters.items():
-        if param.annotation != inspect.Parameter.empty:
-            annotation = str(param.annotation).replace('typing.', '').replace('<class \'', '').replace('\'>', '')
-        else:
-            annotation = "value"
-        
-        if param.default != inspect.Parameter.empty:
-            if isinstance(param.default, str):
-                default_example = f'"{param.default}"'
-            elif param.default is None:
-                default_example = 'null'
-            else:
-                default_example = str(param.default)
-            lines.append(f'    "{param_name}": {default_example}  // Optional, default: {param.default}')
-        else:
-            if 'str' in annotation.lower():
-                example = '"your_value_here"'
-            elif 'int' in annotation.lower():
-                example = '123'
-            elif 'bool' in annotation.lower():
-                example = 'true'
-            elif 'list' in annotation.lower() or 'List' in annotation:
-                example = '["item1", "item2"]'
-            elif 'dict' in annotation.lower() or 'Dict' in annotation:
-                example = '{"key": "value"}'
-            else:
-                example = '"your_value_here"'
-            lines.append(f'    "{param_name}": {example}')
+@lru_cache(maxsize=None)
+def _signature(func):
+    """Return inspect.signature(func), computed once per function."""
+    return inspect.signature(func)
+
+
+def _write_if_changed(path, content, mode=0o644):
+    """Write content to path in one call, leaving the file alone if it is already up to date."""
+    data = content.encode('utf-8')
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
     
-    return ',\n'.join(lines)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    return True
+
+
+def generate_cli_wrapper(functions, temp_dir):
+    """Generate the CLI entry point and the usage table for all functions."""
+    script_path = temp_dir / "cli.py"
+    usage_path = temp_dir / "usage.json"
+    
+    usage = {func_name: _generate_usage(func) for func_name, func in sorted(functions.items())}
+    
+    # The entry point is created executable
+    _write_if_changed(script_path, _DISPATCHER_SOURCE, 0o755)
+    _write_if_changed(usage_path, json.dumps(usage, indent=2, default=repr) + "\n")
+    
+    return script_path, usage_path
 
 
-def _generate_param_extraction(sig):
-    """Generate parameter extraction code for function signature."""
-    lines = []
-    for param_name, param in sig.parameters.items():
+def _generate_usage(func):
+    """Generate the description and example config for a function."""
+    required = {}
+    optional = {}
+    for param in _signature(func).parameters.values():
         if param.default != inspect.Parameter.empty:
-            # Optional parameter with default
-            lines.append(f'        {param_name} = config.get("{param_name}", {repr(param.default)})')
-        else:
-            # Required parameter
-            lines.append(f'        {param_name} = config["{param_name}"]')
+            optional[param.name] = param.default
+            continue
+        
+        # List[str], Dict[str, Any], ... are looked up by their origin; unions get the default
+        annotation = param.annotation
+        if not isinstance(annotation, type):
+            annotation = typing.get_origin(annotation)
+        required[param.name] = _TYPE_EXAMPLES.get(annotation, _DEFAULT_EXAMPLE)
+    
+    doc = inspect.getdoc(func)
+    return {
+        'description': doc.splitlines()[0] if doc else "",
+        'required': required,
+        'optional': optional
+    }
+
+
+def _module_mtimes():
+    """Map each asp_utils module file to its modification time."""
+    package_dir = Path(asp_utils.__file__).parent
+    return {path: path.stat().st_mtime_ns for path in package_dir.glob("*.py")}
+
+
+def watch(cli_wrappers_dir):
+    """Regenerate the CLI whenever an asp_utils module changes, until interrupted."""
+    mtimes = _module_mtimes()
+    print(f"👀 Watching {Path(asp_utils.__file__).parent}/ for changes (Ctrl+C to stop)...")
     
-    return '\n'.join(lines)
+    try:
+        while True:
+            time.sleep(_WATCH_INTERVAL)
+            current_mtimes = _module_mtimes()
+            changed = [path for path, mtime in current_mtimes.items() if mtimes.get(path) != mtime]
+            mtimes = current_mtimes
+            if not changed:
+                continue
+            
+            changed_names = ', '.join(path.name for path in changed)
+            try:
+                # Reload the changed modules, then the package so its exports point at the new functions
+                for path in changed:
+                    module = sys.modules.get(f"asp_utils.{path.stem}")
+                    if module is not None:
+                        importlib.reload(module)
+                importlib.reload(asp_utils)
+                _signature.cache_clear()
+                
+                functions = get_asp_utils_functions()
+                generate_cli_wrapper(functions, cli_wrappers_dir)
+                print(f"🔄 {changed_names} changed; regenerated CLI for {len(functions)} functions")
+            except Exception as e:
+                print(f"❌ Failed to regenerate after change to {changed_names}: {e}")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
 
 
 def main():
-    """Main function to generate all CLI wrappers."""
+    """Main function to generate the CLI wrapper."""
+    parser = argparse.ArgumentParser(
+        description="Generate the CLI wrapper for asp_utils functions"
+    )
+    
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and regenerate whenever an asp_utils module changes"
+    )
+    
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("ASP Utils CLI Wrapper Generator")
     print("=" * 60)
@@ -225,7 +309,7 @@ def main():
     # Create new session for this conversation
     print("🆕 Creating new session...")
     from session_manager import SessionManager
-    session_manager = SessionManager()
+    session_manager = SessionManager(verbose=False)
     session_name = session_manager.create_new_session()
     print(f"📁 Created new session: {session_name}")
     
@@ -243,35 +327,37 @@ def main():
     
     print()
     
-    # Generate CLI wrappers
-    print("🔧 Generating CLI wrappers...")
-    generated_scripts = []
+    # Generate the CLI entry point
+    print("🔧 Generating CLI wrapper...")
+    script_path, usage_path = generate_cli_wrapper(functions, cli_wrappers_dir)
+    print(f"   ✅ {script_path.name}")
+    print(f"   ✅ {usage_path.name}")
     
-    for func_name, func in functions.items():
-        try:
-            script_path = generate_cli_wrapper(func_name, func, cli_wrappers_dir)
-            generated_scripts.append(script_path)
-            print(f"   ✅ {script_path.name}")
-        except Exception as e:
-            print(f"   ❌ Failed to generate wrapper for {func_name}: {e}")
-            import traceback
-            traceback.print_exc()
+    # Remove per-function wrappers left over from earlier versions
+    for stale_script in cli_wrappers_dir.glob("cli_*.py"):
+        stale_script.unlink()
+        print(f"   🗑️  Removed stale {stale_script.name}")
     
     print()
     print("=" * 60)
     print("GENERATION COMPLETE")
     print("=" * 60)
-    print(f"✅ Successfully generated {len(generated_scripts)} CLI wrapper scripts")
+    print(f"✅ Successfully generated a CLI wrapper for {len(functions)} functions")
     print(f"📁 Location: {cli_wrappers_dir}/")
+    print(f"📋 Config formats: {usage_path}")
     print()
     print("Usage examples:")
-    for script in sorted(generated_scripts)[:3]:  # Show first 3 as examples
-        print(f"   python {cli_wrappers_dir}/{script.name} temp/sessions/SESSION_FOLDER/config.json")
-    if len(generated_scripts) > 3:
-        print(f"   ... and {len(generated_scripts) - 3} more")
+    for func_name in sorted(functions)[:3]:  # Show first 3 as examples
+        print(f"   python {script_path} {func_name} temp/sessions/SESSION_FOLDER/config.json")
+    if len(functions) > 3:
+        print(f"   ... and {len(functions) - 3} more")
     print()
     print("🎉 Ready to use asp_utils functions via CLI!")
+    
+    if args.watch:
+        print()
+        watch(cli_wrappers_dir)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -6,24 +6,124 @@ Manages session folders and audit trails for CLI wrapper usage.
 Each conversation gets its own timestamped session folder.
 """
 
-import json
+import atexit
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # optional, parses and serializes faster than json
+    orjson = None
+
+# Highest config number handed out per session folder, shared by every SessionManager in
+# this process so that managers writing to the same session keep numbering in step
+_last_config_numbers: Dict[Path, int] = {}
+
+# Hidden folder in each session with an empty file per config number handed out. Numbers
+# are claimed by creating these exclusively, so processes sharing a session never reuse one,
+# even for configs with different prefixes.
+_CLAIMED_NUMBERS_DIR = ".claimed_numbers"
+
+# Managers handed out by get_session_manager(), one per working directory
+_session_managers: Dict[str, "SessionManager"] = {}
+
+
+def _count_config_files(session_path: Union[str, Path]) -> int:
+    """Count the config files in a session folder in one scandir pass."""
+    with os.scandir(session_path) as entries:
+        return sum(1 for entry in entries if entry.name.endswith(".json") and entry.name != "session_info.json")
+
+
+def _find_last_config_number(session_path: Path) -> int:
+    """Return the highest number among a session folder's config files and claimed numbers."""
+    last_number = 0
+    with os.scandir(session_path) as entries:
+        for entry in entries:
+            number, separator, _ = entry.name.partition("_")
+            if separator and number.isdigit() and entry.name.endswith(".json"):
+                last_number = max(last_number, int(number))
+    
+    try:
+        with os.scandir(session_path / _CLAIMED_NUMBERS_DIR) as claims:
+            for claim in claims:
+                if claim.name.isdigit():
+                    last_number = max(last_number, int(claim.name))
+    except FileNotFoundError:
+        pass
+    
+    return last_number
+
+
+def _claim_config_number(session_path: Path, number: int) -> bool:
+    """Claim a config number for this process; return False if it was already taken."""
+    claim_path = session_path / _CLAIMED_NUMBERS_DIR / f"{number:03d}"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+    try:
+        fd = os.open(claim_path, flags)
+    except FileNotFoundError:
+        claim_path.parent.mkdir(exist_ok=True)
+        return _claim_config_number(session_path, number)
+    except FileExistsError:
+        return False
+    os.close(fd)
+    return True
+
+
+def _read_json(path: Union[str, Path]) -> Any:
+    """Read and parse a JSON file."""
+    with open(path, 'rb') as f:
+        content = f.read()
+    
+    if orjson is not None:
+        return orjson.loads(content)
+    
+    import json  # only needed without orjson
+    return json.loads(content)
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    """Write data to path as indented JSON with a single write call."""
+    if orjson is not None:
+        content = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        import json  # only needed without orjson
+        content = json.dumps(data, indent=2).encode('utf-8')
+    
+    with open(path, 'wb') as f:
+        f.write(content)
 
 
 class SessionManager:
     """Manages session folders and audit trail for CLI wrapper usage."""
     
-    def __init__(self, base_dir: str = "temp"):
-        self.base_dir = Path(base_dir)
+    # Absolute sessions directories already created by an earlier instance in this process
+    _ensured_dirs: set = set()
+    
+    def __init__(self, base_dir: str = "temp", verbose: bool = True):
+        # Resolved now so a later chdir does not move a manager that is already in use
+        self.base_dir = Path(base_dir).resolve()
+        self.verbose = verbose
         self.sessions_dir = self.base_dir / "sessions"
         self.current_session_file = self.base_dir / "current_session.txt"
         self.config_counter = 1
         
+        # Session name resolved by get_current_session(), reused until a new session is forced
+        self._session_name: Optional[str] = None
+        self._session_path: Optional[Path] = None
+        
+        # Contents of that session's session_info.json, read at most once
+        self._session_metadata: Optional[Dict[str, Any]] = None
+        
+        # Creation time of the newest config not yet recorded in session_info.json; see flush()
+        self._unflushed_at: Optional[str] = None
+        atexit.register(self.flush)
+        
         # Ensure directories exist
-        self.sessions_dir.mkdir(parents=True, exist_ok=True)
+        if self.sessions_dir not in SessionManager._ensured_dirs:
+            self.sessions_dir.mkdir(parents=True, exist_ok=True)
+            SessionManager._ensured_dirs.add(self.sessions_dir)
     
     def get_current_session(self) -> str:
         """
@@ -33,6 +133,9 @@ class SessionManager:
         Returns:
             str: Session folder name (e.g., "2025-01-20_14-30-15")
         """
+        if self._session_name is not None:
+            return self._session_name
+        
         # Check if current session file exists and is valid
         if self.current_session_file.exists():
             try:
@@ -42,6 +145,7 @@ class SessionManager:
                 # Verify session folder exists
                 session_path = self.sessions_dir / session_name
                 if session_path.exists():
+                    self._session_name = session_name
                     return session_name
             except Exception:
                 pass
@@ -51,7 +155,8 @@ class SessionManager:
     
     def _create_new_session(self) -> str:
         """Create a new session folder with timestamp."""
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        now = datetime.now()
+        timestamp = f"{now.year:04d}-{now.month:02d}-{now.day:02d}_{now.hour:02d}-{now.minute:02d}-{now.second:02d}"
         session_name = timestamp
         session_path = self.sessions_dir / session_name
         
@@ -61,51 +166,83 @@ class SessionManager:
         # Create session metadata
         metadata = {
             "session_id": session_name,
-            "created_at": datetime.now().isoformat(),
+            "created_at": now.isoformat(),
             "config_count": 0,
             "description": "Atlas Stream Processing session"
         }
         
         metadata_file = session_path / "session_info.json"
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        _write_json(metadata_file, metadata)
         
         # Update current session file
         with open(self.current_session_file, 'w') as f:
             f.write(session_name)
         
-        print(f"📁 Created new session: {session_name}")
+        self._session_name = session_name
+        self._session_path = session_path
+        _last_config_numbers.pop(session_path, None)
+        self._session_metadata = metadata
+        if self.verbose:
+            print(f"📁 Created new session: {session_name}")
         return session_name
     
     def create_new_session(self) -> str:
         """Force creation of a new session, regardless of existing sessions."""
+        self.invalidate()
         return self._create_new_session()
     
+    def invalidate(self):
+        """
+        Forget the cached current session so the next lookup re-reads current_session.txt.
+        
+        Only needed when another process may have switched sessions since this manager
+        resolved its own; pending metadata for the old session is written first.
+        """
+        self.flush()
+        self._session_name = None
+        self._session_path = None
+        self._session_metadata = None
+    
     def get_session_path(self) -> Path:
         """Get the full path to the current session folder."""
-        session_name = self.get_current_session()
-        return self.sessions_dir / session_name
+        if self._session_path is None:
+            self._session_path = self.sessions_dir / self.get_current_session()
+        return self._session_path
+    
+    def _get_session_metadata(self) -> Dict[str, Any]:
+        """Get the current session's metadata, reading session_info.json on first use."""
+        if self._session_metadata is None:
+            try:
+                self._session_metadata = _read_json(self.get_session_path() / "session_info.json")
+            except (OSError, ValueError):
+                self._session_metadata = {}
+        
+        return self._session_metadata
+    
+    def _get_last_config_number(self) -> int:
+        """Get the highest config number handed out in the current session."""
+        session_path = self.get_session_path()
+        if session_path not in _last_config_numbers:
+            # Scan the folder rather than trusting config_count, which may not be flushed yet
+            _last_config_numbers[session_path] = _find_last_config_number(session_path)
+        
+        return _last_config_numbers[session_path]
     
     def get_next_config_filename(self, prefix: str = "config") -> str:
         """
         Get the next config filename with auto-incrementing number.
         
+        The number is only claimed when create_config_file() writes the config, so
+        another process may still take it first.
+        
         Args:
             prefix: Prefix for the config file (default: "config")
             
         Returns:
             str: Filename like "001_config.json", "002_examine_data.json", etc.
         """
-        session_path = self.get_session_path()
-        
-        # Find existing config files to determine next number
-        existing_configs = list(session_path.glob("*.json"))
-        
-        # Filter out session_info.json
-        config_files = [f for f in existing_configs if f.name != "session_info.json"]
-        
         # Get next number
-        next_num = len(config_files) + 1
+        next_num = self._get_last_config_number() + 1
         
         # Generate filename
         filename = f"{next_num:03d}_{prefix}.json"
@@ -123,50 +260,62 @@ class SessionManager:
             Path: Full path to the created config file
         """
         session_path = self.get_session_path()
-        filename = self.get_next_config_filename(prefix)
+        
+        # Another process writing to this session may have taken the expected number;
+        # if so, rescan the folder and try the number after the highest one in use
+        number = self._get_last_config_number() + 1
+        while not _claim_config_number(session_path, number):
+            number = max(number, _find_last_config_number(session_path)) + 1
+        _last_config_numbers[session_path] = number
+        
+        filename = f"{number:03d}_{prefix}.json"
         config_path = session_path / filename
         
-        # Add metadata to config
+        # Add metadata to config; the same timestamp later becomes the session's updated_at
+        created_at = datetime.now().isoformat()
         config_with_metadata = {
-            "created_at": datetime.now().isoformat(),
-            "session_id": session_path.name,
+            "created_at": created_at,
+            "session_id": self.get_current_session(),
             "config_type": prefix,
             **config_data
         }
         
         # Write config file
-        with open(config_path, 'w') as f:
-            json.dump(config_with_metadata, f, indent=2)
+        _write_json(config_path, config_with_metadata)
         
-        # Update session metadata
-        self._update_session_metadata()
+        # Session metadata is written once by flush() rather than after every config
+        self._unflushed_at = created_at
         
-        print(f"📝 Created config: {filename}")
+        if self.verbose:
+            print(f"📝 Created config: {filename}")
         return config_path
     
-    def _update_session_metadata(self):
-        """Update session metadata with current config count."""
-        session_path = self.get_session_path()
-        metadata_file = session_path / "session_info.json"
-        
-        # Count config files (excluding session_info.json)
-        config_files = [f for f in session_path.glob("*.json") if f.name != "session_info.json"]
-        config_count = len(config_files)
+    def flush(self):
+        """
+        Write the session metadata if configs were created since it was last written.
         
-        # Update metadata
-        if metadata_file.exists():
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
-        else:
-            metadata = {}
+        Runs automatically at interpreter exit; call it directly when session_info.json
+        must be up to date sooner.
+        """
+        if self._unflushed_at is not None:
+            self._update_session_metadata(self._get_last_config_number(), self._unflushed_at)
+            self._unflushed_at = None
+    
+    def _update_session_metadata(self, config_count: int, updated_at: str):
+        """Update session metadata with the given config count and update time."""
+        metadata_file = self.get_session_path() / "session_info.json"
         
+        # Update the cached metadata and write it out; the file itself is never re-read
+        metadata = self._get_session_metadata()
         metadata.update({
             "config_count": config_count,
-            "updated_at": datetime.now().isoformat()
+            "updated_at": updated_at
         })
         
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        # Write a temporary file and swap it in, so readers never see a half-written file
+        temp_file = metadata_file.with_name("session_info.json.tmp")
+        _write_json(temp_file, metadata)
+        os.replace(temp_file, metadata_file)
     
     def list_sessions(self) -> list:
         """List all available sessions."""
@@ -174,27 +323,36 @@ class SessionManager:
             return []
         
         sessions = []
-        for session_dir in self.sessions_dir.iterdir():
-            if session_dir.is_dir():
-                metadata_file = session_dir / "session_info.json"
-                if metadata_file.exists():
-                    with open(metadata_file, 'r') as f:
-                        metadata = json.load(f)
-                    sessions.append(metadata)
-                else:
+        with os.scandir(self.sessions_dir) as session_dirs:
+            for session_dir in session_dirs:
+                if not session_dir.is_dir(follow_symlinks=False):
+                    continue
+                
+                try:
+                    sessions.append(_read_json(os.path.join(session_dir.path, "session_info.json")))
+                except FileNotFoundError:
                     # Session without metadata
                     sessions.append({
                         "session_id": session_dir.name,
                         "created_at": "unknown",
-                        "config_count": len(list(session_dir.glob("*.json")))
+                        "config_count": _count_config_files(session_dir.path)
                     })
         
         return sorted(sessions, key=lambda x: x.get("created_at", ""), reverse=True)
 
 
 def get_session_manager() -> SessionManager:
-    """Get a SessionManager instance for the current working directory."""
-    return SessionManager()
+    """
+    Get the SessionManager for the current working directory.
+    
+    Repeated calls return the same instance, so the session it resolved (or created
+    when none existed) is not looked up on disk again.
+    """
+    cwd = os.getcwd()
+    session_manager = _session_managers.get(cwd)
+    if session_manager is None:
+        session_manager = _session_managers[cwd] = SessionManager()
+    return session_manager
 
 
 if __name__ == "__main__":